@@ -6,21 +6,15 @@ Script to add accountCreatedDate to all BEL profiles based on business logic:
 - 2 people joined in September 2025 (already set)
 """
 
-import json
-import random
-from datetime import datetime, timedelta
+import argparse
+from datetime import datetime
 
-def generate_random_date(start_date, end_date):
-    """Generate a random date between start_date and end_date"""
-    time_between = end_date - start_date
-    days_between = time_between.days
-    random_days = random.randrange(days_between)
-    return start_date + timedelta(days=random_days)
+from data_deltas import append_ops, load_with_deltas
+from synthetic_data import DEFAULT_SEED, draw_join_date_job, run_sharded
 
-def main():
+def main(master_seed=DEFAULT_SEED, workers=1):
     # Read the current belProfiles.json
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_with_deltas('belProfiles.json')
     
     # Define date ranges
     early_joiners_start = datetime(2024, 1, 1)
@@ -35,6 +29,9 @@ def main():
     september_count = 0
     already_has_date = 0
     
+    jobs = []
+    pending = []
+    
     for bel in data['leaderboard']:
         # Skip if already has accountCreatedDate
         if 'accountCreatedDate' in bel:
@@ -43,25 +40,34 @@ def main():
                 september_count += 1
             continue
         
-        # Assign dates based on business logic
+        # Assign date windows based on business logic
         if early_count < 21:
             # Early joiners (before July 2025)
-            random_date = generate_random_date(early_joiners_start, early_joiners_end)
-            bel['accountCreatedDate'] = random_date.strftime('%Y-%m-%d')
+            start, end = early_joiners_start, early_joiners_end
             early_count += 1
         elif august_count < 3:
             # August 2025 joiners
-            random_date = generate_random_date(august_joiners_start, august_joiners_end)
-            bel['accountCreatedDate'] = random_date.strftime('%Y-%m-%d')
+            start, end = august_joiners_start, august_joiners_end
             august_count += 1
         else:
             # Default to early joiner if we somehow have more
-            random_date = generate_random_date(early_joiners_start, early_joiners_end)
-            bel['accountCreatedDate'] = random_date.strftime('%Y-%m-%d')
+            start, end = early_joiners_start, early_joiners_end
+        
+        pending.append(bel)
+        jobs.append({
+            'id': bel['id'],
+            'start': start.strftime('%Y-%m-%d'),
+            'end': end.strftime('%Y-%m-%d')
+        })
+    
+    # Each BEL draws its date from its own seeded stream
+    ops = []
+    for bel, created in zip(pending, run_sharded(draw_join_date_job, jobs, master_seed, workers)):
+        bel['accountCreatedDate'] = created
+        ops.append({'op': 'set_account_date', 'belId': bel['id'], 'date': created})
     
-    # Write back to file
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Append to the change log (folded into belProfiles.json by data_deltas.py compact)
+    append_ops('belProfiles.json', ops)
     
     print(f"Account dates added successfully!")
     print(f"Early joiners (before July 2025): {early_count}")
@@ -71,4 +77,8 @@ def main():
     print(f"Total BELs: {len(data['leaderboard'])}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Add accountCreatedDate to BEL profiles")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Master random seed")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    args = parser.parse_args()
+    main(args.seed, args.workers)
\ No newline at end of file
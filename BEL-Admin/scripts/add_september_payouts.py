@@ -4,75 +4,25 @@
 根據BEL的級別和8月份的數據來生成9月份的合理數據
 """
 
-import json
-import random
-from typing import Dict, Any
+import argparse
+
+from data_deltas import append_ops, load_with_deltas
+from synthetic_data import DEFAULT_SEED, draw_september_payout_job, run_sharded
 
 def load_bel_profiles():
     """載入BEL個人資料以獲取級別信息"""
     try:
-        with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-            profiles = json.load(f)
-            # 創建BEL ID到級別的映射
-            level_map = {}
-            for bel in profiles.get('leaderboard', []):
-                level_map[bel['id']] = bel['level']
-            return level_map
+        profiles = load_with_deltas('belProfiles.json')
+        # 創建BEL ID到級別的映射
+        level_map = {}
+        for bel in profiles.get('leaderboard', []):
+            level_map[bel['id']] = bel['level']
+        return level_map
     except Exception as e:
         print(f"無法載入BEL個人資料: {e}")
         return {}
 
-def calculate_september_payout(bel_id: str, august_data: Dict, bel_level: str) -> Dict[str, Any]:
-    """根據8月數據和BEL級別計算9月的payout數據"""
-    
-    # 級別係數 - 不同級別的表現差異
-    level_multipliers = {
-        'Leader': (1.05, 1.15),     # Leader級別表現較好
-        'Exploder': (0.95, 1.10),  # Exploder級別中等表現
-        'Enabler': (0.85, 1.05),   # Enabler級別穩定表現  
-        'Builder': (0.80, 1.00),   # Builder級別基礎表現
-        'Explorer': (0.75, 0.95)   # Explorer級別較低表現
-    }
-    
-    # 獲取級別係數範圍，如果級別未知使用默認值
-    min_mult, max_mult = level_multipliers.get(bel_level, (0.85, 1.05))
-    
-    # 9月份通常是旺季開始，基礎增長係數
-    september_factor = random.uniform(1.02, 1.12)
-    
-    # 級別隨機係數
-    level_factor = random.uniform(min_mult, max_mult)
-    
-    # 總體係數
-    total_factor = september_factor * level_factor
-    
-    # 基於8月數據計算9月數據
-    august_gross = august_data.get('grossPayout', 1000.0)
-    
-    # 計算9月的gross payout
-    september_gross = round(august_gross * total_factor, 2)
-    
-    # WHT通常是gross payout的20%
-    september_wht = round(september_gross * 0.20, 2)
-    
-    # Net payout = gross - wht
-    september_net = round(september_gross - september_wht, 2)
-    
-    # 生成唯一的payout ID
-    payout_id = f"PO-2025-{bel_id[-3:]}-09"
-    
-    return {
-        "payoutId": payout_id,
-        "year": 2025,
-        "month": 9,
-        "date": "2025-09-12",
-        "grossPayout": september_gross,
-        "wht": september_wht,
-        "netPayout": september_net,
-        "status": "Completed"
-    }
-
-def add_september_payouts():
+def add_september_payouts(master_seed=DEFAULT_SEED, workers=1):
     """為所有BEL添加2025年9月的payout數據"""
     
     # 載入BEL級別信息
@@ -80,11 +30,13 @@ def add_september_payouts():
     print(f"載入了 {len(level_map)} 個BEL的級別信息")
     
     # 載入payout數據
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/payouts.json', 'r', encoding='utf-8') as f:
-        payout_data = json.load(f)
+    payout_data = load_with_deltas('payouts.json')
     
     updated_count = 0
     skipped_count = 0
+    jobs = []
+    pending = []
+    ops = []
     
     for bel_entry in payout_data['belPayoutHistory']:
         bel_id = bel_entry['belId']
@@ -116,18 +68,21 @@ def add_september_payouts():
                 august_data = {'grossPayout': 1000.0}
             print(f"BEL {bel_id} 沒有2025年8月數據，使用 {august_data.get('grossPayout', 1000)} 作為基準")
         
-        # 生成9月數據
-        september_payout = calculate_september_payout(bel_id, august_data, bel_level)
-        
+        pending.append((bel_entry, bel_level))
+        jobs.append({'id': bel_id, 'level': bel_level, 'base': august_data})
+    
+    # 生成9月數據（每個BEL使用獨立的亂數串流）
+    september_payouts = run_sharded(draw_september_payout_job, jobs, master_seed, workers)
+    for (bel_entry, bel_level), september_payout in zip(pending, september_payouts):
         # 添加到payoutHistory
         bel_entry['payoutHistory'].append(september_payout)
+        ops.append({'op': 'append_payout', 'belId': bel_entry['belId'], 'payout': september_payout})
         
-        print(f"為BEL {bel_id} ({bel_level}) 添加9月數據: ${september_payout['netPayout']:.2f}")
+        print(f"為BEL {bel_entry['belId']} ({bel_level}) 添加9月數據: ${september_payout['netPayout']:.2f}")
         updated_count += 1
     
-    # 保存更新後的數據
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/payouts.json', 'w', encoding='utf-8') as f:
-        json.dump(payout_data, f, indent=2, ensure_ascii=False)
+    # 寫入變更紀錄（由 data_deltas.py compact 合併回 payouts.json）
+    append_ops('payouts.json', ops)
     
     print(f"\n=== 更新完成 ===")
     print(f"已更新: {updated_count} 個BEL")
@@ -144,4 +99,8 @@ def add_september_payouts():
         print(f"  {level}: {count} 個BEL")
 
 if __name__ == "__main__":
-    add_september_payouts()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="添加2025年9月Payout數據")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="主亂數種子")
+    parser.add_argument("--workers", type=int, default=1, help="平行處理的process數量")
+    args = parser.parse_args()
+    add_september_payouts(args.seed, args.workers)
\ No newline at end of file
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Cohort and join-date index over belProfiles.json.
+
+accountCreatedDate values are sorted once per region (plus 'all'), so "BELs
+that had joined by the end of month M" is a binary search instead of a scan
+over every profile. BELs without a join date count as early joiners, matching
+the dashboard.
+
+Also tabulates cohorts (join month x activity month, months from the join
+month on): how many BELs of each cohort had orders in a month, and that
+count as a share of the cohort (retention).
+
+Writes data/belCohorts.json:
+- joinDates[region]: sorted join dates, undated[region]: BELs without one
+- activeBelCount[region]["YYYY-MM"]: BELs joined by the end of the month
+- cohorts["YYYY-MM"]: {size, active: {"YYYY-MM": n}, retention: {"YYYY-MM": ratio}}
+
+Usage:
+    python3 bel_cohorts.py                                   # build belCohorts.json
+    python3 bel_cohorts.py --active 2025-02 --region Japan   # single lookup
+"""
+
+import argparse
+import calendar
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Tuple
+
+from bel_dataset import MONTH_NAMES, save_json
+from data_deltas import load_with_deltas
+
+OUTPUT_FILE = 'belCohorts.json'
+
+
+def end_of_month(year: int, month: int) -> str:
+    """Last calendar day of the month as 'YYYY-MM-DD'"""
+    return f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
+
+
+def month_range(start: str, end: str) -> List[str]:
+    """'YYYY-MM' keys from start to end inclusive"""
+    year, month = int(start[:4]), int(start[5:7])
+    months = []
+    while f"{year}-{month:02d}" <= end:
+        months.append(f"{year}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class CohortIndex:
+    """Sorted join dates per region with binary-search month-end counts"""
+
+    def __init__(self, profiles: Iterable[Dict[str, Any]]):
+        self.join_dates: Dict[str, List[str]] = {'all': []}
+        self.undated: Dict[str, int] = {'all': 0}
+        for bel in profiles:
+            created = (bel.get('accountCreatedDate') or '')[:10]
+            for region in ('all', bel.get('region', 'Others')):
+                if created:
+                    self.join_dates.setdefault(region, []).append(created)
+                else:
+                    self.undated[region] = self.undated.get(region, 0) + 1
+                    self.join_dates.setdefault(region, [])
+        for dates in self.join_dates.values():
+            dates.sort()
+
+    @property
+    def regions(self) -> List[str]:
+        return [r for r in self.join_dates if r != 'all']
+
+    def joined_by(self, date: str, region: str = 'all') -> int:
+        """BELs whose join date is on or before 'YYYY-MM-DD'"""
+        dates = self.join_dates.get(region)
+        if dates is None:
+            return 0
+        return bisect_right(dates, date) + self.undated.get(region, 0)
+
+    def active_at(self, year: int, month: int, region: str = 'all') -> int:
+        """BELs that had joined by the end of the month"""
+        return self.joined_by(end_of_month(year, month), region)
+
+
+def activity_months(bel: Dict[str, Any]) -> Iterable[Tuple[str, int]]:
+    """('YYYY-MM', orders) for every month in the BEL's monthlyData"""
+    for year, months in bel.get('monthlyData', {}).items():
+        for name, data in months.items():
+            if name in MONTH_NAMES:
+                yield f"{year}-{MONTH_NAMES.index(name) + 1:02d}", data.get('orders', 0)
+
+
+def cohort_tables(profiles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Join month x activity month: BELs with orders, and share of the cohort"""
+    cohorts: Dict[str, Dict[str, Any]] = {}
+    for bel in profiles:
+        join_month = (bel.get('accountCreatedDate') or '')[:7]
+        if not join_month:
+            continue
+        cohort = cohorts.setdefault(join_month, {'size': 0, 'active': {}})
+        cohort['size'] += 1
+        for month, orders in activity_months(bel):
+            if orders > 0 and month >= join_month:
+                cohort['active'][month] = cohort['active'].get(month, 0) + 1
+
+    for join_month, cohort in cohorts.items():
+        cohort['active'] = dict(sorted(cohort['active'].items()))
+        cohort['retention'] = {month: round(n / cohort['size'], 4) for month, n in cohort['active'].items()}
+    return dict(sorted(cohorts.items()))
+
+
+def build() -> Dict[str, Any]:
+    """Build and write belCohorts.json"""
+    profiles = load_with_deltas('belProfiles.json').get('leaderboard', [])
+    index = CohortIndex(profiles)
+
+    # Every month covered by join dates or monthlyData
+    known = {month for bel in profiles for month, _ in activity_months(bel)}
+    known.update(date[:7] for date in index.join_dates['all'])
+    months = month_range(min(known), max(known)) if known else []
+
+    active_counts = {
+        region: {m: index.active_at(int(m[:4]), int(m[5:7]), region) for m in months}
+        for region in ['all'] + sorted(index.regions)
+    }
+
+    output = {
+        'generatedAt': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'months': months,
+        'joinDates': index.join_dates,
+        'undated': index.undated,
+        'activeBelCount': active_counts,
+        'cohorts': cohort_tables(profiles),
+        'description': 'BEL 加入日期索引與 cohort 活躍/留存表（由 scripts/bel_cohorts.py 產生）'
+    }
+    save_json(output, OUTPUT_FILE, inline_leaves=True)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the BEL cohort / join-date index')
+    parser.add_argument('--active', metavar='YYYY-MM', help='Print BELs joined by the end of this month and exit')
+    parser.add_argument('--region', default='all', help='Region for --active (default all)')
+    args = parser.parse_args(argv)
+
+    if args.active:
+        try:
+            year, month = int(args.active[:4]), int(args.active[5:7])
+            end = end_of_month(year, month)
+        except (ValueError, calendar.IllegalMonthError):
+            parser.error('--active must look like YYYY-MM')
+        index = CohortIndex(load_with_deltas('belProfiles.json').get('leaderboard', []))
+        print(f"{index.active_at(year, month, args.region)} BELs joined by {end} ({args.region})")
+        return
+
+    result = build()
+    print(f"已產生 {len(result['cohorts'])} 個 cohort（{result['months'][0]} ~ {result['months'][-1]}）-> data/{OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Shared loaders for the BEL data files.
+
+Flattens belProfiles.json, payouts.json and orders.json into column-oriented
+tables (one list per field) with lazily built value -> row indexes, so the
+query and reporting scripts can filter and group without rescanning the
+nested JSON for every question.
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))
+
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+
+MONTH_INDEX = {name: i + 1 for i, name in enumerate(MONTH_NAMES)}
+
+
+def data_path(filename: str) -> str:
+    """Return the absolute path of a file in BEL-Admin/data"""
+    return os.path.join(DATA_DIR, filename)
+
+
+def load_json(filename: str) -> Any:
+    """Load a JSON file from the data directory"""
+    with open(data_path(filename), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# An indented JSON object that contains no nested object or array
+_FLAT_OBJECT = re.compile(r'\{\n\s*([^{}\[\]]*?)\n\s*\}')
+
+
+def save_json(data: Any, filename: str, compact: bool = False, inline_leaves: bool = False) -> None:
+    """Save a JSON file to the data directory.
+
+    compact writes generated outputs without whitespace; inline_leaves keeps
+    the repo's indented layout but puts flat objects (table rows) on one line.
+    """
+    with open(data_path(filename), 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        elif inline_leaves:
+            text = json.dumps(data, indent=2, ensure_ascii=False, separators=(',', ':'))
+            f.write(_FLAT_OBJECT.sub(lambda m: '{' + re.sub(r',\n\s*', ',', m.group(1)) + '}', text))
+        else:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def save_json_section(value: Any, filename: str, key: str) -> None:
+    """Rewrite one top-level key of an indent=2 JSON file, leaving the rest of the text untouched"""
+    with open(data_path(filename), 'r', encoding='utf-8') as f:
+        text = f.read()
+    match = re.search(r'^  "%s": ' % re.escape(key), text, re.M)
+    if not match:
+        raise ValueError(f"{filename} has no top-level '{key}'")
+    _, end = json.JSONDecoder().raw_decode(text, match.end())
+    section = json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+    with open(data_path(filename), 'w', encoding='utf-8') as f:
+        f.write(text[:match.end()] + section + text[end:])
+
+
+def iter_records(filename: str, key: str, chunk_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """Stream the objects of the top-level array `key` without loading the whole file"""
+    decoder = json.JSONDecoder()
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    with open(data_path(filename), 'r', encoding='utf-8') as f:
+        buf = ''
+        while True:
+            chunk = f.read(chunk_size)
+            buf += chunk
+            match = start.search(buf)
+            if match:
+                buf = buf[match.end():]
+                break
+            if not chunk:
+                return
+            buf = buf[-(len(key) + 64):]
+
+        eof = False
+        while True:
+            buf = buf.lstrip()
+            if buf.startswith(','):
+                buf = buf[1:].lstrip()
+            if buf.startswith(']'):
+                return
+            try:
+                if not buf:
+                    raise ValueError('need more data')
+                record, end = decoder.raw_decode(buf)
+            except ValueError:
+                if eof:
+                    raise ValueError(f"Truncated array '{key}' in {filename}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf += chunk
+                continue
+            yield record
+            buf = buf[end:]
+
+
+class ColumnTable:
+    """Column-oriented table with cached equality indexes"""
+
+    def __init__(self, columns: Dict[str, List[Any]], metrics: Iterable[str] = ()):
+        self.columns = columns
+        self.metrics = list(metrics)
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        self.size = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def index(self, column: str) -> Dict[Any, List[int]]:
+        """Return (and cache) a value -> ascending row ids index for a column"""
+        if column not in self._indexes:
+            if column not in self.columns:
+                raise KeyError(f"Unknown column: {column}")
+            idx: Dict[Any, List[int]] = {}
+            for row, value in enumerate(self.columns[column]):
+                idx.setdefault(value, []).append(row)
+            self._indexes[column] = idx
+        return self._indexes[column]
+
+    def select(self, filters: Dict[str, Iterable[Any]]) -> List[int]:
+        """Return the sorted row ids whose columns match every filter.
+
+        Each filter maps a column to the set of accepted values. Candidate rows
+        come from the index of the most selective filter and are narrowed by
+        the remaining ones.
+        """
+        if not filters:
+            return list(range(self.size))
+
+        candidates = []
+        for column, accepted in filters.items():
+            idx = self.index(column)
+            rows: List[int] = []
+            for value in set(accepted):
+                rows.extend(idx.get(value, ()))
+            candidates.append(rows)
+
+        candidates.sort(key=len)
+        selected = set(candidates[0])
+        for rows in candidates[1:]:
+            if not selected:
+                break
+            selected.intersection_update(rows)
+        return sorted(selected)
+
+
+def _profile_lookup(profiles: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Map BEL id to the dimensions shared by every table"""
+    lookup = {}
+    for bel in profiles.get('leaderboard', []):
+        created = bel.get('accountCreatedDate') or ''
+        lookup[bel['id']] = {
+            'name': bel.get('name', ''),
+            'region': bel.get('region', 'Others'),
+            'level': bel.get('level', 'Unknown'),
+            'cohort': created[:7] or 'Unknown',
+        }
+    return lookup
+
+
+def build_metrics_table(profiles: Dict[str, Any]) -> ColumnTable:
+    """One row per BEL per month from belProfiles.json monthlyData"""
+    columns: Dict[str, List[Any]] = {key: [] for key in (
+        'belId', 'belName', 'region', 'level', 'cohort', 'year', 'month',
+        'clicks', 'orders', 'revenue')}
+    for bel in profiles.get('leaderboard', []):
+        created = bel.get('accountCreatedDate') or ''
+        for year_str, year_data in bel.get('monthlyData', {}).items():
+            year = int(year_str)
+            for month_name, month_data in year_data.items():
+                month = MONTH_INDEX.get(month_name)
+                if month is None:
+                    continue
+                columns['belId'].append(bel['id'])
+                columns['belName'].append(bel.get('name', ''))
+                columns['region'].append(bel.get('region', 'Others'))
+                columns['level'].append(bel.get('level', 'Unknown'))
+                columns['cohort'].append(created[:7] or 'Unknown')
+                columns['year'].append(year)
+                columns['month'].append(month)
+                columns['clicks'].append(month_data.get('clicks', 0))
+                columns['orders'].append(month_data.get('orders', 0))
+                columns['revenue'].append(month_data.get('revenue', 0))
+    return ColumnTable(columns, metrics=('clicks', 'orders', 'revenue'))
+
+
+def build_payouts_table(payouts: Dict[str, Any], profiles: Dict[str, Any]) -> ColumnTable:
+    """One row per payout record from payouts.json"""
+    lookup = _profile_lookup(profiles)
+    columns: Dict[str, List[Any]] = {key: [] for key in (
+        'belId', 'belName', 'region', 'level', 'cohort', 'year', 'month',
+        'status', 'grossPayout', 'wht', 'netPayout')}
+    for entry in payouts.get('belPayoutHistory', []):
+        bel_id = entry['belId']
+        dims = lookup.get(bel_id, {})
+        for payout in entry.get('payoutHistory', []):
+            columns['belId'].append(bel_id)
+            columns['belName'].append(entry.get('belName', dims.get('name', '')))
+            columns['region'].append(entry.get('belRegion', dims.get('region', 'Others')))
+            columns['level'].append(dims.get('level', 'Unknown'))
+            columns['cohort'].append(dims.get('cohort', 'Unknown'))
+            columns['year'].append(payout.get('year'))
+            columns['month'].append(payout.get('month'))
+            columns['status'].append(payout.get('status', ''))
+            columns['grossPayout'].append(payout.get('grossPayout', 0))
+            columns['wht'].append(payout.get('wht', 0))
+            columns['netPayout'].append(payout.get('netPayout', 0))
+    return ColumnTable(columns, metrics=('grossPayout', 'wht', 'netPayout'))
+
+
+def build_orders_table(orders: Dict[str, Any], profiles: Dict[str, Any]) -> ColumnTable:
+    """One row per order from orders.json history"""
+    lookup = _profile_lookup(profiles)
+    columns: Dict[str, List[Any]] = {key: [] for key in (
+        'belId', 'belName', 'region', 'level', 'cohort', 'year', 'month',
+        'status', 'currency', 'amount')}
+    for order in orders.get('history', []):
+        bel_id = order.get('referralId', '')
+        dims = lookup.get(bel_id, {})
+        order_date = order.get('orderDate', '')
+        columns['belId'].append(bel_id)
+        columns['belName'].append(order.get('belName', dims.get('name', '')))
+        columns['region'].append(dims.get('region', 'Others'))
+        columns['level'].append(dims.get('level', 'Unknown'))
+        columns['cohort'].append(dims.get('cohort', 'Unknown'))
+        columns['year'].append(int(order_date[:4]) if order_date[:4].isdigit() else None)
+        columns['month'].append(int(order_date[5:7]) if order_date[5:7].isdigit() else None)
+        columns['status'].append(order.get('status', ''))
+        columns['currency'].append(order.get('currency', ''))
+        columns['amount'].append(order.get('amount', 0))
+    return ColumnTable(columns, metrics=('amount',))
+
+
+def load_table(name: str, profiles: Optional[Dict[str, Any]] = None) -> ColumnTable:
+    """Load one of the 'metrics', 'payouts' or 'orders' tables (change logs applied)"""
+    from data_deltas import load_with_deltas  # data_deltas imports this module
+
+    if profiles is None:
+        profiles = load_with_deltas('belProfiles.json')
+    if name == 'metrics':
+        return build_metrics_table(profiles)
+    if name == 'payouts':
+        return build_payouts_table(load_with_deltas('payouts.json'), profiles)
+    if name == 'orders':
+        return build_orders_table(load_json('orders.json'), profiles)
+    raise ValueError(f"Unknown table: {name}")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Precompute customer insights and sales series per referral ID.
+
+Streams orders.json once and writes data/customerInsights.json, keyed by
+referralId, so the BEL detail modal renders without scanning orders or
+synthesizing sales data on the client:
+- monthlySales: {"YYYY-MM": {"orders", "amount": {currency: amount}}}
+- orderStatusByYear: {"YYYY": {status: order count}}
+- totalOrders / totalAmount ({currency: amount}): all orders of the BEL
+- repeatCustomerRatio: share of orders from returning customers
+  (null while orders.json carries no customer field)
+- productMixByYear: {"YYYY" | "all": {topCategories, categoryRevenue,
+  topProducts: {productName: quantity}, totalQuantity, totalRevenue}}, a
+  product mix estimate from
+  productCatalog.json levelFactor weights and the BEL's revenue in that year
+  (the revenue the modal shows for the header year filter), using the
+  modal's formula but drawn from the BEL's seeded stream; the modal looks
+  product descriptions and prices up in productCatalog.json
+
+Amounts stay per currency; orders.json mixes currencies, so they are never
+summed across them.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+from bel_dataset import MONTH_INDEX, iter_records, save_json
+from data_deltas import load_with_deltas
+from product_catalog import ProductCatalog, load_catalog
+from synthetic_data import DEFAULT_SEED, bel_rng
+
+OUTPUT_FILE = 'customerInsights.json'
+TOP_CATEGORIES = 4
+TOP_PRODUCTS = 10
+
+
+def empty_stats() -> Dict[str, Any]:
+    return {'monthlySales': {}, 'orderStatusByYear': {}, 'totalOrders': 0, 'totalAmount': {},
+            'customers': {}, 'hasCustomerIds': False}
+
+
+def aggregate_orders() -> Dict[str, Dict[str, Any]]:
+    """One pass over orders.json -> per referralId series and breakdowns"""
+    per_bel: Dict[str, Dict[str, Any]] = {}
+    for order in iter_records('orders.json', 'history'):
+        referral_id = order.get('referralId')
+        if not referral_id:
+            continue
+        stats = per_bel.get(referral_id)
+        if stats is None:
+            stats = per_bel[referral_id] = empty_stats()
+        month = order.get('orderDate', '')[:7]
+        amount = order.get('amount', 0)
+        currency = order.get('currency', 'USD')
+        bucket = stats['monthlySales'].setdefault(month, {'orders': 0, 'amount': {}})
+        bucket['orders'] += 1
+        bucket['amount'][currency] = bucket['amount'].get(currency, 0) + amount
+        status = order.get('status', 'Unknown')
+        status_counts = stats['orderStatusByYear'].setdefault(month[:4], {})
+        status_counts[status] = status_counts.get(status, 0) + 1
+        stats['totalOrders'] += 1
+        stats['totalAmount'][currency] = stats['totalAmount'].get(currency, 0) + amount
+        customer = order.get('customerId')
+        if customer:
+            stats['hasCustomerIds'] = True
+            stats['customers'][customer] = stats['customers'].get(customer, 0) + 1
+    return per_bel
+
+
+def repeat_customer_ratio(stats: Dict[str, Any]):
+    """Share of orders placed by customers with more than one order"""
+    if not stats['hasCustomerIds'] or not stats['totalOrders']:
+        return None
+    repeat_orders = sum(count for count in stats['customers'].values() if count > 1)
+    return round(repeat_orders / stats['totalOrders'], 4)
+
+
+def yearly_revenue(bel: Dict[str, Any], today: date) -> Dict[str, int]:
+    """Revenue per year as the modal sums it (current year only up to this month)"""
+    revenue = {}
+    for year, months in bel.get('monthlyData', {}).items():
+        revenue[year] = sum(
+            data.get('revenue', 0) for name, data in months.items()
+            if not (year == str(today.year) and name in MONTH_INDEX and MONTH_INDEX[name] > today.month)
+        )
+    return revenue
+
+
+def estimate_product_mix(bel: Dict[str, Any], revenue: int, catalog: ProductCatalog,
+                         rng) -> List[Dict[str, Any]]:
+    """Product mix for one BEL and revenue, sorted by quantity (modal's generateSalesData formula)"""
+    if revenue == 0:
+        return []
+
+    level = bel.get('level', 'Exploder')
+    base_order_count = revenue // 300
+    sales = []
+    for product, level_multiplier in zip(catalog.products, catalog.level_column(level)):
+        random_factor = 0.3 + rng.random() * 0.7
+        quantity = int(base_order_count * level_multiplier * random_factor * 0.08)
+        if quantity > 0:
+            sales.append({
+                'productName': product['name'],
+                'productDescription': product.get('description', ''),
+                'category': product.get('category', ''),
+                'quantity': quantity,
+                'avgPrice': product.get('avgPrice', 0),
+                'totalRevenue': quantity * product.get('avgPrice', 0)
+            })
+    sales.sort(key=lambda s: s['quantity'], reverse=True)
+    return sales
+
+
+def summarize_mix(sales: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Top categories / products and totals of one product mix"""
+    category_quantity: Dict[str, int] = {}
+    category_revenue: Dict[str, int] = {}
+    for sale in sales:
+        category_quantity[sale['category']] = category_quantity.get(sale['category'], 0) + sale['quantity']
+        category_revenue[sale['category']] = category_revenue.get(sale['category'], 0) + sale['totalRevenue']
+    top_categories = sorted(category_quantity, key=category_quantity.get, reverse=True)[:TOP_CATEGORIES]
+    return {
+        'topCategories': top_categories,
+        'categoryRevenue': {c: category_revenue[c] for c in top_categories},
+        'topProducts': {s['productName']: s['quantity'] for s in sales[:TOP_PRODUCTS]},
+        'totalQuantity': sum(s['quantity'] for s in sales),
+        'totalRevenue': sum(s['totalRevenue'] for s in sales)
+    }
+
+
+def build(master_seed: int = DEFAULT_SEED) -> Dict[str, Any]:
+    """Build and write customerInsights.json"""
+    profiles = load_with_deltas('belProfiles.json').get('leaderboard', [])
+    catalog = load_catalog()
+    order_stats = aggregate_orders()
+
+    today = date.today()
+    insights = {}
+    for bel in profiles:
+        stats = order_stats.get(bel['id']) or empty_stats()
+        revenue = yearly_revenue(bel, today)
+        revenue['all'] = sum(revenue.values())
+
+        insights[bel['id']] = {
+            'monthlySales': {
+                month: {'orders': v['orders'], 'amount': {c: round(a, 2) for c, a in sorted(v['amount'].items())}}
+                for month, v in sorted(stats['monthlySales'].items())
+            },
+            'orderStatusByYear': dict(sorted(stats['orderStatusByYear'].items())),
+            'totalOrders': stats['totalOrders'],
+            'totalAmount': {c: round(a, 2) for c, a in sorted(stats['totalAmount'].items())},
+            'repeatCustomerRatio': repeat_customer_ratio(stats),
+            'productMixByYear': {
+                year: summarize_mix(estimate_product_mix(bel, amount, catalog,
+                                                         bel_rng(master_seed, bel['id'], f'productMix:{year}')))
+                for year, amount in sorted(revenue.items()) if amount
+            }
+        }
+
+    output = {
+        'generatedAt': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'insights': insights,
+        'description': '每個BEL的客戶洞察與銷售序列（由 scripts/build_customer_insights.py 產生）'
+    }
+    save_json(output, OUTPUT_FILE, compact=True)
+    return output
+
+
+if __name__ == "__main__":
+    result = build()
+    print(f"已產生 {len(result['insights'])} 個BEL的客戶洞察 -> data/{OUTPUT_FILE}")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build dashboard.json productAnalysis from BEL sales and productCatalog.json.
+
+orders.json is a sample of order records without product lines, so sales
+volume comes from the monthly order revenue in belProfiles.json. Revenue is
+grouped by (year, region, level) in one pass, then split across catalog
+products with the level's levelFactor weights (units = revenue share /
+avgPrice). Per level this is a fixed column of the catalog's product x level
+matrix (product_catalog.py), so every cell is a weighted sum of at most four
+vectors: year and region filters change volumes and the level blend, but the
+product ranking within a level never changes, so cells with a similar level
+mix show nearly the same ranking.
+
+Writes into dashboard.json productAnalysis (only that key is rewritten):
+- categoryDataByYearRegion[year][region][category]: top 5 categories, top 5 {product: units} each
+  (client-side fallback for cells without the ready-made series)
+- categoryTotalsByYearRegion[year|all][region|all]: top 5 [{category, units, revenue}] (category chart)
+- topProductsByYearRegion[year|all][region|all]: top 20 {product: units} by units (Top Products table,
+  prices come from productCatalog.json)
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from bel_dataset import load_json, save_json_section
+from data_deltas import load_with_deltas
+from product_catalog import load_catalog
+
+TOP_CATEGORIES = 5
+PRODUCTS_PER_CATEGORY = 5
+TOP_PRODUCTS = 20
+
+
+def group_revenue(profiles: List[Dict[str, Any]]) -> Dict[Tuple[str, str, str], float]:
+    """Sum monthly revenue by (year, region, level)"""
+    totals: Dict[Tuple[str, str, str], float] = {}
+    for bel in profiles:
+        region = bel.get('region', 'Others')
+        level = bel.get('level', 'Builder')
+        for year, months in bel.get('monthlyData', {}).items():
+            revenue = sum(m.get('revenue', 0) for m in months.values())
+            if revenue:
+                key = (year, region, level)
+                totals[key] = totals.get(key, 0) + revenue
+    return totals
+
+
+def summarize(units: List[float], products: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Category product lists, category totals and top products for one cell"""
+    rows = [(p, round(u)) for p, u in zip(products, units)]
+    rows = [(p, u) for p, u in rows if u > 0]
+    rows.sort(key=lambda r: (-r[1], r[0]['name']))
+
+    categories: Dict[str, Dict[str, int]] = {}
+    totals: Dict[str, Dict[str, Any]] = {}
+    for product, u in rows:
+        category = product.get('category', 'Others')
+        entries = categories.setdefault(category, {})
+        if len(entries) < PRODUCTS_PER_CATEGORY:
+            entries[product['name']] = u
+        total = totals.setdefault(category, {'category': category, 'units': 0, 'revenue': 0})
+        total['units'] += u
+        total['revenue'] += u * product['avgPrice']
+
+    top_totals = sorted(totals.values(), key=lambda t: (-t['units'], t['category']))[:TOP_CATEGORIES]
+    return {
+        'categoryData': {t['category']: categories[t['category']] for t in top_totals},
+        'categoryTotals': top_totals,
+        'topProducts': {p['name']: u for p, u in rows[:TOP_PRODUCTS]}
+    }
+
+
+def build() -> Dict[str, Any]:
+    """Rebuild dashboard.json productAnalysis"""
+    dashboard = load_json('dashboard.json')
+    profiles = load_with_deltas('belProfiles.json').get('leaderboard', [])
+    catalog = load_catalog()
+    analysis = dashboard.get('productAnalysis', {})
+
+    revenue = group_revenue(profiles)
+
+    # Keep every region the dashboard filter offers, so empty regions render empty
+    regions: List[str] = []
+    known = [r for key in ('categoryTotalsByYearRegion', 'categoryDataByYearRegion')
+             for year_map in analysis.get(key, {}).values() for r in year_map]
+    for region in known + [bel.get('region', 'Others') for bel in profiles]:
+        if region not in regions and region != 'all':
+            regions.append(region)
+    years = sorted({year for year, _, _ in revenue})
+
+    # Revenue per level for every (year|all, region|all) cell
+    cells: Dict[Tuple[str, str], Dict[str, float]] = {}
+    for (year, region, level), amount in revenue.items():
+        for key in ((year, region), (year, 'all'), ('all', region), ('all', 'all')):
+            by_level = cells.setdefault(key, {})
+            by_level[level] = by_level.get(level, 0) + amount
+
+    category_data: Dict[str, Dict[str, Any]] = {}
+    category_totals: Dict[str, Dict[str, Any]] = {}
+    top_products: Dict[str, Dict[str, Any]] = {}
+    for year in years + ['all']:
+        for region in regions + ['all']:
+            summary = summarize(catalog.product_units(cells.get((year, region), {})), catalog.products)
+            if year != 'all' and region != 'all':
+                category_data.setdefault(year, {})[region] = summary['categoryData']
+            category_totals.setdefault(year, {})[region] = summary['categoryTotals']
+            top_products.setdefault(year, {})[region] = summary['topProducts']
+
+    analysis['categoryDataByYearRegion'] = category_data
+    analysis['categoryTotalsByYearRegion'] = category_totals
+    analysis['topProductsByYearRegion'] = top_products
+    analysis['topProducts'] = analysis.get('topProducts', [])
+    save_json_section(analysis, 'dashboard.json', 'productAnalysis')
+    return analysis
+
+
+if __name__ == "__main__":
+    result = build()
+    years = [year for year in result['categoryTotalsByYearRegion'] if year != 'all']
+    print(f"已更新 dashboard.json productAnalysis（年份: {', '.join(years)}）")
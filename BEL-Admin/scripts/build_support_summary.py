@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Index contactSupport.json tickets and aggregate support SLA figures.
+
+One pass over the tickets builds indexes by status, BEL (referralId) and
+month, and measures per ticket:
+- first response: questionTime -> first reply
+- resolution: questionTime -> last reply of a Closed ticket (replying closes
+  a ticket in the admin portal, and tickets carry no separate close time)
+
+Writes data/supportSummary.json with per-status counts and ticket lists,
+per-BEL open-ticket counts, monthly counts, SLA percentiles (hours) and the
+open tickets older than the aging threshold, so the support view and scripts
+can use them without rescanning the tickets. Tickets whose replies predate
+the question are left out of the SLA figures and listed under
+inconsistentTickets. ticketsDigest (ticket count plus an FNV-1a hash of every
+ticket number and status) lets the support view tell whether the summary
+still matches the tickets it loaded.
+
+Usage:
+    python3 build_support_summary.py                       # aging relative to now
+    python3 build_support_summary.py --aging-hours 24 --as-of "2025-08-29 09:00"
+"""
+
+import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from bel_dataset import load_json, save_json
+
+OUTPUT_FILE = 'supportSummary.json'
+TIME_FORMAT = '%Y-%m-%d %H:%M'
+AGING_HOURS = 48
+PERCENTILES = (50, 90, 95)
+
+
+def parse_time(value: str) -> Optional[datetime]:
+    """Parse 'YYYY-MM-DD HH:MM' (also accepts ISO 'T' separator), None if invalid"""
+    try:
+        return datetime.strptime((value or '')[:16].replace('T', ' '), TIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def hours_between(start: datetime, end: datetime) -> float:
+    return (end - start).total_seconds() / 3600
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """Linear-interpolated percentile of already sorted values"""
+    if len(values) == 1:
+        return values[0]
+    rank = (len(values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def sla_stats(hours: List[float]) -> Dict[str, Any]:
+    """count / pXX / max of a list of durations in hours"""
+    if not hours:
+        return {'count': 0}
+    hours = sorted(hours)
+    stats: Dict[str, Any] = {'count': len(hours)}
+    for p in PERCENTILES:
+        stats[f'p{p}'] = round(percentile(hours, p), 2)
+    stats['max'] = round(hours[-1], 2)
+    return stats
+
+
+def tickets_digest(tickets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Ticket count and 32-bit FNV-1a hash of "number\\tstatus\\n" lines (mirrored in app.js)"""
+    text = ''.join(f"{t.get('ticketNumber', '')}\t{t.get('status', '')}\n" for t in tickets)
+    value = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        value = ((value ^ byte) * 0x01000193) & 0xffffffff
+    return {'count': len(tickets), 'hash': f"{value:08x}"}
+
+
+def summarize(tickets: List[Dict[str, Any]], as_of: datetime, aging_hours: float = AGING_HOURS) -> Dict[str, Any]:
+    """Indexes and SLA figures for a ticket list"""
+    by_status: Dict[str, List[str]] = {}
+    by_bel: Dict[str, Dict[str, Any]] = {}
+    by_month: Dict[str, Dict[str, int]] = {}
+    ticket_index: Dict[str, int] = {}
+    first_response: List[float] = []
+    resolution: List[float] = []
+    aging: List[Dict[str, Any]] = []
+    inconsistent: List[str] = []
+
+    for position, ticket in enumerate(tickets):
+        number = ticket.get('ticketNumber', '')
+        status = ticket.get('status', 'Unknown')
+        is_open = status == 'Open'
+        ticket_index[number] = position
+        by_status.setdefault(status, []).append(number)
+
+        referral_id = ticket.get('referralId', '')
+        bel = by_bel.setdefault(referral_id, {'belName': ticket.get('belName', ''), 'total': 0, 'open': 0})
+        bel['total'] += 1
+
+        asked = parse_time(ticket.get('questionTime', ''))
+        month = by_month.setdefault(ticket.get('questionTime', '')[:7], {'total': 0, 'open': 0})
+        month['total'] += 1
+        if is_open:
+            bel['open'] += 1
+            month['open'] += 1
+        if not asked:
+            continue
+
+        reply_times = [t for t in (parse_time(r.get('time', '')) for r in ticket.get('replies', [])) if t]
+        if reply_times and min(reply_times) < asked:
+            inconsistent.append(number)
+        elif reply_times:
+            first_response.append(hours_between(asked, min(reply_times)))
+            if status == 'Closed':
+                resolution.append(hours_between(asked, max(reply_times)))
+
+        if is_open:
+            age = hours_between(asked, as_of)
+            if age >= aging_hours:
+                aging.append({
+                    'ticketNumber': number,
+                    'referralId': referral_id,
+                    'belName': ticket.get('belName', ''),
+                    'questionTime': ticket.get('questionTime', ''),
+                    'ageHours': round(age, 1)
+                })
+
+    aging.sort(key=lambda t: -t['ageHours'])
+    for ticket in aging:
+        bel = by_bel[ticket['referralId']]
+        bel['oldestOpenHours'] = max(bel.get('oldestOpenHours', 0), ticket['ageHours'])
+
+    return {
+        'asOf': as_of.strftime(TIME_FORMAT),
+        'ticketsDigest': tickets_digest(tickets),
+        'agingThresholdHours': aging_hours,
+        'counts': {status: len(numbers) for status, numbers in by_status.items()},
+        'byStatus': by_status,
+        'byBel': dict(sorted(by_bel.items(), key=lambda item: (-item[1]['open'], item[0]))),
+        'byMonth': dict(sorted(by_month.items())),
+        'ticketIndex': ticket_index,
+        'sla': {
+            'firstResponseHours': sla_stats(first_response),
+            'resolutionHours': sla_stats(resolution)
+        },
+        'agingTickets': aging,
+        'inconsistentTickets': inconsistent
+    }
+
+
+def build(as_of: Optional[datetime] = None, aging_hours: float = AGING_HOURS) -> Dict[str, Any]:
+    """Build and write supportSummary.json"""
+    tickets = load_json('contactSupport.json').get('tickets', [])
+    output = {
+        'generatedAt': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        **summarize(tickets, as_of or datetime.now(), aging_hours),
+        'description': '支援票券索引與 SLA 統計（由 scripts/build_support_summary.py 產生）'
+    }
+    save_json(output, OUTPUT_FILE)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the support ticket index and SLA summary')
+    parser.add_argument('--aging-hours', type=float, default=AGING_HOURS,
+                        help=f'Flag open tickets older than this many hours (default {AGING_HOURS})')
+    parser.add_argument('--as-of', help='Reference time "YYYY-MM-DD HH:MM" for ticket age (default now)')
+    args = parser.parse_args(argv)
+
+    as_of = None
+    if args.as_of:
+        as_of = parse_time(args.as_of)
+        if as_of is None:
+            parser.error('--as-of must look like "YYYY-MM-DD HH:MM"')
+
+    result = build(as_of, args.aging_hours)
+    counts = ', '.join(f"{status} {count}" for status, count in result['counts'].items())
+    print(f"已產生支援摘要 -> data/{OUTPUT_FILE}（{counts}）")
+    for name, stats in result['sla'].items():
+        if stats['count']:
+            print(f"  {name}: p50 {stats['p50']}h, p90 {stats['p90']}h, max {stats['max']}h (n={stats['count']})")
+
+    if result['inconsistentTickets']:
+        print(f"  ⚠️  {len(result['inconsistentTickets'])} 張票券的回覆時間早於提問時間，未計入 SLA")
+
+    if result['agingTickets']:
+        print(f"⚠️  {len(result['agingTickets'])} 張 Open 票券超過 {args.aging_hours:g} 小時未處理:")
+        for ticket in result['agingTickets']:
+            print(f"  {ticket['ticketNumber']}  {ticket['referralId']:<12} {ticket['belName']:<20} {ticket['ageHours']}h")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Append-only change logs for the BEL data files.
+
+Mutating scripts no longer rewrite belProfiles.json or payouts.json. They
+append typed operations to `<file>.deltas.jsonl` next to the base snapshot,
+and readers apply base + deltas on load. `compact` folds the log into a new
+base snapshot and empties it.
+
+`compact` first renames the log to `<file>.deltas.jsonl.compacting`, so
+batches appended while it runs start a new log instead of being dropped.
+Readers apply the compacting log (if any) before the live one; replaying ops
+that are already in the base snapshot is harmless. Writers and compact take
+an exclusive flock on the log, readers a shared one.
+
+Operations (one JSON object per line):
+    {"op": "set_metric", "belId": ..., "year": "2025", "month": "September",
+     "values": {"clicks": 700, "orders": 20, "revenue": 18266}}
+    {"op": "set_account_date", "belId": ..., "date": "2025-08-03"}
+    {"op": "set_level", "belId": ..., "level": "Leader", "previous": "Exploder"}
+    {"op": "append_payout", "belId": ..., "payout": {...payout record...}}
+
+Usage:
+    python3 data_deltas.py status
+    python3 data_deltas.py compact belProfiles.json
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List
+
+from bel_dataset import data_path, load_json
+
+DELTA_SUFFIX = '.deltas.jsonl'
+COMPACTING_SUFFIX = '.compacting'
+
+# Files that may carry a change log, and the list / id key used to find a BEL
+DELTA_FILES = {
+    'belProfiles.json': ('leaderboard', 'id'),
+    'payouts.json': ('belPayoutHistory', 'belId'),
+}
+
+
+def delta_path(filename: str) -> str:
+    """Return the change log path for a data file"""
+    return data_path(filename[:-len('.json')] + DELTA_SUFFIX)
+
+
+def _read_log(path: str) -> List[Dict[str, Any]]:
+    """Operations of one log file (empty if it does not exist)"""
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return []
+    ops = []
+    with f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        for line in f:
+            # A line without its newline is a batch still being written
+            # (or cut short by a crash): it is not part of the log yet.
+            if not line.endswith('\n'):
+                break
+            if line.strip():
+                ops.append(json.loads(line))
+    return ops
+
+
+def read_ops(filename: str) -> List[Dict[str, Any]]:
+    """Read every operation in a file's change log (empty if there is none)"""
+    path = delta_path(filename)
+    return _read_log(path + COMPACTING_SUFFIX) + _read_log(path)
+
+
+def _open_log(filename: str) -> int:
+    """Open the live change log for appending and lock it exclusively
+
+    compact may rename the log between open and lock; retry until the locked
+    file is still the live log.
+    """
+    path = delta_path(filename)
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_ino == os.stat(path).st_ino:
+                return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+
+def _drop_partial_line(fd: int) -> None:
+    """Truncate a log (opened and locked by _open_log) after its last newline"""
+    size = os.fstat(fd).st_size
+    end = size
+    while end > 0:
+        start = max(0, end - 4096)
+        chunk = os.pread(fd, end - start, start)
+        newline = chunk.rfind(b'\n')
+        if newline != -1:
+            end = start + newline + 1
+            break
+        end = start
+    if end != size:
+        print(f"Warning: dropping {size - end} bytes of an unfinished batch from the change log", file=sys.stderr)
+        os.ftruncate(fd, end)
+
+
+def append_ops(filename: str, ops: Iterable[Dict[str, Any]]) -> int:
+    """Append operations to a file's change log, returns how many were written
+
+    The batch is all-or-nothing: every op is validated first, then the whole
+    batch goes to the log in a single O_APPEND write under the log's exclusive
+    lock and is fsynced. A partial last line left by a crashed writer is cut
+    off before appending, so it never merges with the next batch. Python
+    readers take the shared lock and see whole batches only; readers without
+    the lock (the portal's fetch) may see the complete leading lines of a
+    batch still being written, and skip its trailing partial line.
+    """
+    if filename not in DELTA_FILES:
+        raise ValueError(f"{filename} does not support change logs")
+    timestamp = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
+    lines = []
+    for op in ops:
+        if op.get('op') not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {op.get('op')}")
+        lines.append(json.dumps(dict(op, ts=timestamp), ensure_ascii=False) + '\n')
+    if not lines:
+        return 0
+
+    buffer = ''.join(lines).encode('utf-8')
+    fd = _open_log(filename)
+    try:
+        _drop_partial_line(fd)
+        written = 0
+        while written < len(buffer):
+            written += os.write(fd, buffer[written:])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return len(lines)
+
+
+def _set_metric(entry: Dict[str, Any], op: Dict[str, Any]) -> None:
+    month_data = entry.setdefault('monthlyData', {}).setdefault(str(op['year']), {}).setdefault(op['month'], {})
+    month_data.update(op['values'])
+
+
+def _set_account_date(entry: Dict[str, Any], op: Dict[str, Any]) -> None:
+    entry['accountCreatedDate'] = op['date']
+
+
+def _set_level(entry: Dict[str, Any], op: Dict[str, Any]) -> None:
+    entry['level'] = op['level']
+
+
+def _append_payout(entry: Dict[str, Any], op: Dict[str, Any]) -> None:
+    history = entry.setdefault('payoutHistory', [])
+    payout = op['payout']
+    # Replaying a log that was already compacted must not duplicate payouts
+    if any(p.get('payoutId') == payout.get('payoutId') and p.get('year') == payout.get('year')
+           and p.get('month') == payout.get('month') for p in history):
+        return
+    history.append(payout)
+
+
+OPERATIONS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    'set_metric': _set_metric,
+    'set_account_date': _set_account_date,
+    'set_level': _set_level,
+    'append_payout': _append_payout,
+}
+
+
+def apply_ops(data: Dict[str, Any], filename: str, ops: Iterable[Dict[str, Any]]) -> int:
+    """Apply operations to a loaded base snapshot in place, returns how many applied"""
+    list_key, id_key = DELTA_FILES[filename]
+    entries = {entry[id_key]: entry for entry in data.get(list_key, [])}
+    applied = 0
+    for op in ops:
+        entry = entries.get(op['belId'])
+        if entry is None:
+            print(f"Warning: {filename} has no BEL {op['belId']}, skipping {op['op']}", file=sys.stderr)
+            continue
+        OPERATIONS[op['op']](entry, op)
+        applied += 1
+    return applied
+
+
+def load_with_deltas(filename: str) -> Any:
+    """Load a data file and apply its change log, if any"""
+    data = load_json(filename)
+    if filename in DELTA_FILES:
+        apply_ops(data, filename, read_ops(filename))
+    return data
+
+
+def compact(filename: str) -> int:
+    """Fold the change log into a new base snapshot, returns the ops folded"""
+    log_path = delta_path(filename)
+    pending = log_path + COMPACTING_SUFFIX
+    # Take the log out of the way under the writers' lock; a compacting log left
+    # by an interrupted run is folded first.
+    if not os.path.exists(pending):
+        try:
+            fd = os.open(log_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return 0
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.replace(log_path, pending)
+        finally:
+            os.close(fd)
+
+    ops = _read_log(pending)
+    if ops:
+        data = load_json(filename)
+        apply_ops(data, filename, ops)
+
+        # Write the new snapshot next to the old one and swap it in atomically,
+        # then drop the compacted log (replaying it again would be harmless).
+        path = data_path(filename)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    os.remove(pending)
+    return len(ops)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Inspect or compact data file change logs')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('status', help='Show pending operations per file')
+    compact_parser = sub.add_parser('compact', help='Fold change logs into the base snapshots')
+    compact_parser.add_argument('files', nargs='*', help='Files to compact (default: all)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'status':
+        for filename in DELTA_FILES:
+            ops = read_ops(filename)
+            counts: Dict[str, int] = {}
+            for op in ops:
+                counts[op['op']] = counts.get(op['op'], 0) + 1
+            detail = ', '.join(f"{name}={count}" for name, count in sorted(counts.items()))
+            print(f"{filename}: {len(ops)} pending" + (f" ({detail})" if detail else ''))
+    else:
+        for filename in args.files or list(DELTA_FILES):
+            if filename not in DELTA_FILES:
+                parser.error(f"{filename} does not support change logs")
+            print(f"{filename}: compacted {compact(filename)} operations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Schema validation for every data file listed in dataConfig.json, plus the
+generated reports the portal does not load at startup (GENERATED_FILES).
+
+Schemas are a small JSON-Schema subset (type, properties, required,
+additionalProperties, items, enum, pattern, minimum, maximum). Each schema is
+compiled once into the source of a single checking function (exec'd on first
+use): type tests, required keys, enum sets and regexes are inlined or bound as
+constants, and JSON paths are only built when an error is recorded.
+
+Files with a top-level record array are streamed record by record
+(bel_dataset.iter_records), and change logs (*.deltas.jsonl) are checked
+line by line. Every error is collected with its JSON path, e.g.
+    $.belPayoutHistory[3].payoutHistory[12].netPayout: expected number, got str
+
+Usage:
+    python3 data_schema.py                    # validate every file in dataConfig.json and GENERATED_FILES
+    python3 data_schema.py payouts belProfiles
+    python3 data_schema.py --max-errors 20
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bel_dataset import MONTH_NAMES, data_path, iter_records, load_json
+from data_deltas import DELTA_FILES, delta_path
+
+# A path is a linked tuple (parent, key), formatted only when an error is reported
+Path = Optional[Tuple[Any, Any]]
+Errors = List[Tuple[Path, str]]
+Checker = Callable[[Any, Path, Errors], None]
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# JSON type -> Python types as produced by json.load (bool is not a number here)
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    'object': (dict,),
+    'array': (list,),
+    'string': (str,),
+    'number': (int, float),
+    'integer': (int,),
+    'boolean': (bool,),
+    'null': (type(None),),
+}
+
+
+def format_path(path: Path) -> str:
+    """Linked (parent, key) path -> '$.a[0].b'"""
+    parts = []
+    while path is not None:
+        path, key = path
+        if isinstance(key, int):
+            parts.append(f"[{key}]")
+        elif _IDENTIFIER.match(key):
+            parts.append(f".{key}")
+        else:
+            parts.append(f"[{json.dumps(key, ensure_ascii=False)}]")
+    return '$' + ''.join(reversed(parts))
+
+
+class _CodeGen:
+    """Turns a schema into the source of one checking function
+
+    Checks are inlined as plain statements on local variables, constants
+    (regexes, enum sets) are bound once in the function's namespace, and the
+    JSON path of a value is only built inside the error branches.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+        self.counter = 0
+
+    def name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name('_c')
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+
+    def error(self, indent: int, path: str, message: str) -> None:
+        self.emit(indent, f"errors.append(({path}, {message}))")
+
+    def node(self, schema: Dict[str, Any], var: str, path: str, indent: int) -> None:
+        """Emit the checks of one schema node for the value in `var`"""
+        if 'type' in schema:
+            names = schema['type'] if isinstance(schema['type'], (list, tuple)) else [schema['type']]
+            types = tuple(t for name in names for t in _TYPES[name])
+            test = (f"_type({var}) is {self.constant(types[0])}" if len(types) == 1
+                    else f"_type({var}) in {self.constant(types)}")
+            self.emit(indent, f"if not ({test}):")
+            self.error(indent + 1, path, f"{'expected ' + ' or '.join(names) + ', got '!r} + _type({var}).__name__")
+            self.emit(indent, "else:")
+            indent += 1
+            self.emit(indent, "pass")
+
+        if 'enum' in schema:
+            allowed = self.constant(frozenset(schema['enum']))
+            shown = ', '.join(map(str, schema['enum']))
+            self.emit(indent, f"if {var} not in {allowed}:")
+            self.error(indent + 1, path, f"repr({var}) + {' not one of: ' + shown!r}")
+
+        if 'pattern' in schema:
+            regex = self.constant(re.compile(schema['pattern']).match)
+            self.emit(indent, f"if _type({var}) is _str and not {regex}({var}):")
+            self.error(indent + 1, path, f"repr({var}) + {' does not match ' + schema['pattern']!r}")
+
+        if 'minimum' in schema or 'maximum' in schema:
+            self.emit(indent, f"if _type({var}) in _numbers:")
+            if 'minimum' in schema:
+                self.emit(indent + 1, f"if {var} < {schema['minimum']!r}:")
+                self.error(indent + 2, path, f"str({var}) + ' below minimum {schema['minimum']}'")
+            if 'maximum' in schema:
+                self.emit(indent + 1, f"if {var} > {schema['maximum']!r}:")
+                self.error(indent + 2, path, f"str({var}) + ' above maximum {schema['maximum']}'")
+
+        if 'properties' in schema or 'required' in schema or 'additionalProperties' in schema:
+            self.object_node(schema, var, path, indent)
+
+        if 'items' in schema:
+            index, item = self.name('i'), self.name('v')
+            self.emit(indent, f"if _type({var}) is _list:")
+            self.emit(indent + 1, f"for {index}, {item} in _enumerate({var}):")
+            self.emit(indent + 2, "pass")
+            self.node(schema['items'], item, f"({path}, {index})", indent + 2)
+
+    def object_node(self, schema: Dict[str, Any], var: str, path: str, indent: int) -> None:
+        properties = schema.get('properties', {})
+        extra = schema.get('additionalProperties', True)
+        required = schema.get('required', ())
+        self.emit(indent, f"if _type({var}) is _dict:")
+        indent += 1
+        self.emit(indent, "pass")
+        for key in required:
+            if key not in properties:
+                self.emit(indent, f"if {key!r} not in {var}:")
+                self.error(indent + 1, path, repr(f"missing required '{key}'"))
+        for key, sub in properties.items():
+            # One lookup per property: fetch, report if required and missing, else check
+            item = self.name('v')
+            self.emit(indent, f"{item} = {var}.get({key!r}, _MISSING)")
+            self.emit(indent, f"if {item} is _MISSING:")
+            if key in required:
+                self.error(indent + 1, path, repr(f"missing required '{key}'"))
+            else:
+                self.emit(indent + 1, "pass")
+            self.emit(indent, "else:")
+            self.emit(indent + 1, "pass")
+            self.node(sub, item, f"({path}, {key!r})", indent + 1)
+        if extra is True:
+            return
+        key, item = self.name('k'), self.name('v')
+        known = self.constant(frozenset(properties))
+        self.emit(indent, f"for {key}, {item} in {var}.items():")
+        self.emit(indent + 1, f"if {key} in {known}:")
+        self.emit(indent + 2, "continue")
+        if extra is False:
+            self.error(indent + 1, f"({path}, {key})", repr('unexpected property'))
+        else:
+            self.node(extra, item, f"({path}, {key})", indent + 1)
+
+
+def compile_schema(schema: Dict[str, Any]) -> Checker:
+    """Compile a schema into a function check(value, path, errors)"""
+    gen = _CodeGen()
+    gen.node(schema, 'value', 'path', 1)
+    # Constants and builtins become default arguments, i.e. fast local lookups
+    bound = dict(gen.namespace, _MISSING=object(), _type=type, _str=str, _list=list, _dict=dict,
+                 _numbers=(int, float), _enumerate=enumerate)
+    header = f"def check(value, path, errors, {', '.join(f'{name}={name}' for name in bound)}):"
+    namespace = dict(bound)
+    exec(compile('\n'.join([header, '    pass'] + gen.lines), '<schema>', 'exec'), namespace)
+    return namespace['check']
+
+
+# --- schemas ---
+
+STRING = {'type': 'string'}
+NUMBER = {'type': 'number'}
+COUNT = {'type': 'integer', 'minimum': 0}
+DATE = {'type': 'string', 'pattern': r'^\d{4}-\d{2}-\d{2}$'}
+DATETIME = {'type': 'string', 'pattern': r'^\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}'}
+YEAR_MONTH = {'type': 'string', 'pattern': r'^\d{4}-\d{2}$'}
+# Every level synthetic_data.LEVEL_PAYOUT_MULTIPLIERS knows
+LEVEL = {'type': 'string', 'enum': ['Builder', 'Enabler', 'Exploder', 'Explorer', 'Leader']}
+
+
+def obj(required=(), extra=True, **properties) -> Dict[str, Any]:
+    """Object schema shorthand: obj(['a'], a=STRING, b=NUMBER)"""
+    return {'type': 'object', 'required': list(required), 'properties': properties, 'additionalProperties': extra}
+
+
+def array(items: Dict[str, Any]) -> Dict[str, Any]:
+    return {'type': 'array', 'items': items}
+
+
+def mapping(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Object with arbitrary keys and uniform values"""
+    return {'type': 'object', 'additionalProperties': values}
+
+
+MONTH_METRICS = obj(['clicks', 'orders', 'revenue'], clicks=COUNT, orders=COUNT, revenue={'type': 'number', 'minimum': 0})
+
+PAYOUT_RECORD = obj(
+    ['payoutId', 'year', 'month', 'date', 'grossPayout', 'wht', 'netPayout', 'status'],
+    payoutId=STRING, year={'type': 'integer', 'minimum': 2000}, month={'type': 'integer', 'minimum': 1, 'maximum': 12},
+    date=DATE, grossPayout=NUMBER, wht=NUMBER, netPayout=NUMBER, status=STRING)
+
+MONTHLY_DATA = {'type': 'object', 'additionalProperties': {
+    'type': 'object',
+    'properties': {month: MONTH_METRICS for month in MONTH_NAMES},
+    'additionalProperties': False}}
+
+BEL_PROFILE = obj(
+    ['id', 'name', 'accountCreatedDate', 'level', 'region', 'monthlyData'],
+    id=STRING, name=STRING, email=STRING, accountCreatedDate=DATE, level=LEVEL, region=STRING, countryCode=STRING,
+    bankingInfo=mapping(STRING), monthlyData=MONTHLY_DATA)
+
+PRODUCT = obj(['name', 'category', 'avgPrice', 'levelFactor'],
+              name=STRING, description=STRING, category=STRING, avgPrice={'type': 'number', 'minimum': 0},
+              levelFactor=mapping({'type': 'number', 'minimum': 0}))
+
+
+# dataConfig name -> (top-level array streamed record by record or None, schema)
+# With a record array, the schema describes one record; otherwise the whole file.
+SCHEMAS: Dict[str, Tuple[Optional[str], Dict[str, Any]]] = {
+    'userProfile': (None, obj(['name', 'email', 'level'], name=STRING, email=STRING, level=STRING,
+                              avatar=STRING, description=STRING)),
+    'header': (None, obj(['portalTitle', 'notifications'], portalTitle=STRING, logo=STRING,
+                         notifications=array(obj(['type', 'title', 'date'], type=STRING, tagText=STRING,
+                                                 title=STRING, date=STRING, details=STRING)))),
+    'dashboard': (None, obj(
+        ['summaryStatsConfig', 'productAnalysis'],
+        summaryStatsConfig=mapping(obj(['title'], title=STRING, icon=STRING, trend=STRING,
+                                       trendText=STRING, status=STRING)),
+        productAnalysis=obj(
+            ['categoryTotalsByYearRegion', 'topProductsByYearRegion'],
+            categoryDataByYearRegion=mapping(mapping(mapping(mapping(COUNT)))),
+            categoryTotalsByYearRegion=mapping(mapping(array(obj(['category', 'units', 'revenue'], category=STRING,
+                                                                 units=COUNT, revenue=NUMBER)))),
+            topProductsByYearRegion=mapping(mapping(mapping(COUNT))),
+            topProducts={'type': 'array'}))),
+    'payouts': ('belPayoutHistory', obj(['belId', 'belName', 'payoutHistory'], belId=STRING, belName=STRING,
+                                        belRegion=STRING, payoutHistory=array(PAYOUT_RECORD))),
+    'orders': ('history', obj(['orderDate', 'orderNumber', 'referralId', 'amount', 'currency', 'status'],
+                              orderDate=DATE, orderNumber=STRING, referralId=STRING, belName=STRING,
+                              amount=NUMBER, currency={'type': 'string', 'pattern': r'^[A-Z]{3}$'}, status=STRING)),
+    'content': ('assets', obj(['uploadDate', 'title', 'category'], uploadDate=DATE, title=STRING, subtitle=STRING,
+                              category=STRING, pageLink=STRING)),
+    'contactSupport': ('tickets', obj(
+        ['ticketNumber', 'referralId', 'status', 'questionTime', 'replies'],
+        ticketNumber=STRING, belName=STRING, referralId=STRING, subject=STRING, message=STRING,
+        status={'type': 'string', 'enum': ['Open', 'Closed']}, questionTime=DATETIME,
+        replies=array(obj(['time', 'text'], time=DATETIME, text=STRING, attachments={'type': 'array'})))),
+    'announcements': ('announcements', obj(['created', 'category', 'title'], created=DATE, category=STRING,
+                                           title=STRING, body=STRING, link=STRING)),
+    'productCatalog': ('productCatalog', PRODUCT),
+    'belProfiles': ('leaderboard', BEL_PROFILE),
+    'customerInsights': (None, obj(['insights'], generatedAt=STRING, insights=mapping(obj(
+        ['monthlySales', 'orderStatusByYear', 'totalOrders', 'productMixByYear'],
+        monthlySales=mapping(obj(['orders', 'amount'], orders=COUNT, amount=mapping(NUMBER))),
+        orderStatusByYear=mapping(mapping(COUNT)), totalOrders=COUNT, totalAmount=mapping(NUMBER),
+        repeatCustomerRatio={'type': ['number', 'null']},
+        productMixByYear=mapping(obj(['topProducts'], topCategories=array(STRING), categoryRevenue=mapping(NUMBER),
+                                     topProducts=mapping(COUNT), totalQuantity=COUNT,
+                                     totalRevenue=NUMBER)))))),
+    'supportSummary': (None, obj(['ticketsDigest', 'counts', 'byStatus', 'byBel', 'ticketIndex', 'sla'],
+                                 ticketsDigest=obj(['count', 'hash'], count=COUNT, hash=STRING),
+                                 counts=mapping(COUNT), byStatus=mapping(array(STRING)),
+                                 byBel=mapping(obj(['total', 'open'], total=COUNT, open=COUNT)),
+                                 byMonth=mapping(obj(['total', 'open'], total=COUNT, open=COUNT)),
+                                 ticketIndex=mapping(COUNT), sla=mapping(obj(['count'], count=COUNT)),
+                                 agingTickets={'type': 'array'}, inconsistentTickets=array(STRING))),
+    'belCohorts': (None, obj(['months', 'joinDates', 'activeBelCount', 'cohorts'],
+                             months=array(YEAR_MONTH), joinDates=mapping(array(DATE)), undated=mapping(COUNT),
+                             activeBelCount=mapping(mapping(COUNT)),
+                             cohorts=mapping(obj(['size', 'active', 'retention'], size=COUNT,
+                                                 active=mapping(COUNT), retention=mapping(NUMBER))))),
+}
+
+# Generated files outside dataConfig.json's load set: name -> file
+GENERATED_FILES = {
+    'customerInsights': 'customerInsights.json',
+    'belCohorts': 'belCohorts.json',
+}
+
+# Change log operations (data_deltas.py)
+_OP_BASE = {'op': STRING, 'belId': STRING, 'ts': STRING}
+DELTA_OPS: Dict[str, Dict[str, Any]] = {
+    'set_metric': obj(['belId', 'year', 'month', 'values'], **_OP_BASE, year=STRING,
+                      month={'type': 'string', 'enum': MONTH_NAMES}, values=mapping(NUMBER)),
+    'set_account_date': obj(['belId', 'date'], **_OP_BASE, date=DATE),
+    'set_level': obj(['belId', 'level'], **_OP_BASE, level=LEVEL, previous=STRING, asOf=STRING),
+    'append_payout': obj(['belId', 'payout'], **_OP_BASE, payout=PAYOUT_RECORD),
+}
+
+# Narrower record checks for scripts that only read a few fields
+RECORD_CHECKS: Dict[str, Dict[str, Any]] = {
+    # verify_data_consistency.py: join date plus monthly metrics, when present
+    'profileJoinDate': obj(['accountCreatedDate'], accountCreatedDate=DATE, monthlyData=MONTHLY_DATA),
+    # validate_september_payouts.py: the one payout record being checked
+    'payoutRecord': PAYOUT_RECORD,
+}
+
+_compiled: Dict[str, Checker] = {}
+
+
+def validator(name: str) -> Checker:
+    """Compiled checker for a SCHEMAS / DELTA_OPS / RECORD_CHECKS entry (compiled on first use)"""
+    if name not in _compiled:
+        schema = SCHEMAS[name][1] if name in SCHEMAS else DELTA_OPS.get(name) or RECORD_CHECKS[name]
+        _compiled[name] = compile_schema(schema)
+    return _compiled[name]
+
+
+def validate(value: Any, schema: str) -> List[str]:
+    """Validate one value against a named schema, returns 'path: message' strings"""
+    errors: Errors = []
+    validator(schema)(value, None, errors)
+    return [f"{format_path(path)}: {message}" for path, message in errors]
+
+
+def validate_file(name: str, filename: str) -> Tuple[int, List[str]]:
+    """Validate one data file (and its change log), returns (records checked, errors)"""
+    record_key, _ = SCHEMAS[name]
+    check = validator(name)
+    errors: Errors = []
+    checked = 0
+    try:
+        if record_key:
+            root = (None, record_key)
+            for i, record in enumerate(iter_records(filename, record_key)):
+                check(record, (root, i), errors)
+                checked += 1
+            if not checked and not isinstance(load_json(filename).get(record_key), list):
+                errors.append((None, f"missing top-level array '{record_key}'"))
+        else:
+            check(load_json(filename), None, errors)
+            checked = 1
+    except (OSError, ValueError) as e:
+        return checked, [f"{filename}: {e}"]
+
+    messages = [f"{format_path(path)}: {message}" for path, message in errors]
+    if filename in DELTA_FILES and os.path.exists(delta_path(filename)):
+        messages.extend(validate_deltas(filename))
+    return checked, messages
+
+
+def validate_deltas(filename: str) -> List[str]:
+    """Check every line of a file's change log"""
+    log_name = os.path.basename(delta_path(filename))
+    messages = []
+    with open(delta_path(filename), 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                op = json.loads(line)
+            except ValueError as e:
+                messages.append(f"{log_name}:{line_no}: invalid JSON ({e})")
+                continue
+            if not isinstance(op, dict) or op.get('op') not in DELTA_OPS:
+                messages.append(f"{log_name}:{line_no}: unknown operation {op.get('op') if isinstance(op, dict) else op!r}")
+                continue
+            messages.extend(f"{log_name}:{line_no}: {error}" for error in validate(op, op['op']))
+    return messages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validate data files against their schemas')
+    parser.add_argument('names', nargs='*', help='dataConfig / GENERATED_FILES names to validate (default: all)')
+    parser.add_argument('--max-errors', type=int, default=50, help='Errors to print per file (default 50)')
+    args = parser.parse_args(argv)
+
+    entries = {e['name']: e['file'] for e in load_json('dataConfig.json').get('dataFiles', [])}
+    entries.update((name, filename) for name, filename in GENERATED_FILES.items() if name not in entries)
+    for name in args.names:
+        if name not in entries:
+            parser.error(f"{name} is not listed in dataConfig.json or GENERATED_FILES")
+    missing = [name for name in entries if name not in SCHEMAS]
+    if missing:
+        print(f"⚠️  No schema for: {', '.join(missing)}")
+
+    failed = 0
+    for name in args.names or list(entries):
+        if name not in SCHEMAS:
+            continue
+        filename = entries[name]
+        if not os.path.exists(data_path(filename)):
+            print(f"✗ {filename}: file not found")
+            failed += 1
+            continue
+        start = time.perf_counter()
+        checked, errors = validate_file(name, filename)
+        elapsed = (time.perf_counter() - start) * 1000
+        if errors:
+            failed += 1
+            print(f"✗ {filename}: {len(errors)} errors ({checked} records, {elapsed:.0f} ms)")
+            for error in errors[:args.max_errors]:
+                print(f"    {error}")
+            if len(errors) > args.max_errors:
+                print(f"    ... {len(errors) - args.max_errors} more")
+        else:
+            print(f"✓ {filename} ({checked} records, {elapsed:.0f} ms)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,9 @@
 Fix BEL profiles data to ensure no data exists before their account creation date
 """
 
-import json
 from datetime import datetime
 
-def load_json(filepath):
-    """Load JSON file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_json(data, filepath):
-    """Save JSON file with proper formatting"""
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+from data_deltas import append_ops, load_with_deltas
 
 def get_month_index(month_name):
     """Convert month name to index (0-11)"""
@@ -27,15 +18,14 @@ def get_month_index(month_name):
 
 def fix_bel_data():
     """Fix BEL data to match account creation dates"""
-    filepath = '/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json'
-    
-    # Load the data
-    data = load_json(filepath)
+    # Load base snapshot + pending change log
+    data = load_with_deltas('belProfiles.json')
     
     if 'leaderboard' not in data:
         print("No leaderboard data found")
         return
     
+    ops = []
     print(f"Processing {len(data['leaderboard'])} BEL profiles...")
     
     for bel in data['leaderboard']:
@@ -68,16 +58,21 @@ def fix_bel_data():
                 current_date = datetime(year_int, month_int, 1)
                 join_month_start = datetime(account_year, account_month, 1)
                 
-                if current_date < join_month_start:
+                if current_date < join_month_start and any(
+                        month_data.get(k, 0) for k in ('clicks', 'orders', 'revenue')):
                     # Clear data for months before joining
-                    month_data['clicks'] = 0
-                    month_data['orders'] = 0
-                    month_data['revenue'] = 0
+                    ops.append({
+                        'op': 'set_metric',
+                        'belId': bel['id'],
+                        'year': year_str,
+                        'month': month_name,
+                        'values': {'clicks': 0, 'orders': 0, 'revenue': 0}
+                    })
                     print(f"  Cleared data for {year_str} {month_name}")
     
-    # Save the updated data
-    save_json(data, filepath)
-    print("Data fixing completed!")
+    # Append the fixes to the change log (belProfiles.deltas.jsonl)
+    written = append_ops('belProfiles.json', ops)
+    print(f"Data fixing completed! {written} months cleared")
 
 if __name__ == "__main__":
     fix_bel_data()
\ No newline at end of file
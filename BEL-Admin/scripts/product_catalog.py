@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Indexed access to productCatalog.json.
+
+Loads the catalog once and builds:
+- name -> product lookup
+- category -> product positions
+- a dense product x level matrix of levelFactor values
+- per (level, category) cumulative weights for weighted sampling
+
+so product mixes and revenue estimates for many BELs are answered in bulk
+without rescanning the product list.
+
+Usage:
+    python3 product_catalog.py                       # catalog summary
+    python3 product_catalog.py --level Leader --category "Remote I/O Modules"
+"""
+
+import argparse
+import bisect
+import random
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from bel_dataset import load_json
+
+LEVELS = ['Builder', 'Enabler', 'Exploder', 'Leader']
+
+
+class ProductCatalog:
+    """productCatalog.json with name, category and level-factor indexes"""
+
+    def __init__(self, products: Sequence[Dict[str, Any]], default_factor: float = 1.0):
+        self.products = list(products)
+        self.default_factor = default_factor
+        self.names = [p['name'] for p in self.products]
+        self.prices = [p.get('avgPrice', 0) for p in self.products]
+        self.by_name = {name: i for i, name in enumerate(self.names)}
+
+        self.by_category: Dict[str, List[int]] = {}
+        for i, product in enumerate(self.products):
+            self.by_category.setdefault(product.get('category', 'Others'), []).append(i)
+
+        levels = list(LEVELS)
+        for product in self.products:
+            for level in product.get('levelFactor', {}):
+                if level not in levels:
+                    levels.append(level)
+        self.levels = levels
+        self.level_index = {level: j for j, level in enumerate(levels)}
+        # factors[i][j]: levelFactor of product i for level j
+        self.factors = [[p.get('levelFactor', {}).get(level, default_factor) for level in levels]
+                        for p in self.products]
+
+        self._cumulative: Dict[Tuple[str, Optional[str]], Tuple[List[int], List[float]]] = {}
+
+    # --- lookups ---
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        i = self.by_name.get(name)
+        return self.products[i] if i is not None else None
+
+    def categories(self) -> List[str]:
+        return list(self.by_category)
+
+    def in_category(self, category: str) -> List[Dict[str, Any]]:
+        return [self.products[i] for i in self.by_category.get(category, ())]
+
+    def factor(self, name: str, level: str) -> float:
+        return self.factors[self.by_name[name]][self.level_index[level]]
+
+    def level_column(self, level: str) -> List[float]:
+        """levelFactor of every product for one level, in catalog order"""
+        j = self.level_index.get(level)
+        if j is None:
+            return [self.default_factor] * len(self.products)
+        return [row[j] for row in self.factors]
+
+    # --- bulk queries ---
+
+    def units_per_revenue(self, level: str) -> List[float]:
+        """Units of each product per revenue dollar when revenue is split by levelFactor share"""
+        weights = self.level_column(level)
+        total = sum(w for w, price in zip(weights, self.prices) if price) or 1.0
+        return [w / total / price if price else 0.0 for w, price in zip(weights, self.prices)]
+
+    def product_units(self, revenue_by_level: Mapping[str, float]) -> List[float]:
+        """Units per product for revenue split across levels (sum of level vectors)"""
+        units = [0.0] * len(self.products)
+        for level, revenue in revenue_by_level.items():
+            if not revenue:
+                continue
+            for i, c in enumerate(self.units_per_revenue(level)):
+                units[i] += revenue * c
+        return units
+
+    def estimate_revenue(self, mixes: Iterable[Mapping[str, int]]) -> List[float]:
+        """Revenue (units x avgPrice) of each product mix {name: units}"""
+        prices = self.prices
+        by_name = self.by_name
+        return [sum(units * prices[by_name[name]] for name, units in mix.items() if name in by_name)
+                for mix in mixes]
+
+    def _weights(self, level: str, category: Optional[str]) -> Tuple[List[int], List[float]]:
+        key = (level, category)
+        if key not in self._cumulative:
+            positions = self.by_category.get(category, []) if category else list(range(len(self.products)))
+            column = self.level_column(level)
+            self._cumulative[key] = (positions, list(accumulate(column[i] for i in positions)))
+        return self._cumulative[key]
+
+    def sample(self, level: str, k: int, rng=random, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Draw k products weighted by levelFactor for the level (with replacement)"""
+        positions, cumulative = self._weights(level, category)
+        if not positions or cumulative[-1] <= 0:
+            return []
+        total = cumulative[-1]
+        return [self.products[positions[bisect.bisect_right(cumulative, rng.random() * total)]]
+                for _ in range(k)]
+
+    def sample_mix(self, level: str, k: int, rng=random, category: Optional[str] = None) -> Dict[str, int]:
+        """Draw k weighted units and count them per product name"""
+        mix: Dict[str, int] = {}
+        for product in self.sample(level, k, rng, category):
+            mix[product['name']] = mix.get(product['name'], 0) + 1
+        return mix
+
+
+_catalog: Optional[ProductCatalog] = None
+
+
+def load_catalog(reload: bool = False) -> ProductCatalog:
+    """Load productCatalog.json once per process"""
+    global _catalog
+    if _catalog is None or reload:
+        _catalog = ProductCatalog(load_json('productCatalog.json').get('productCatalog', []))
+    return _catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Inspect the indexed product catalog')
+    parser.add_argument('--level', choices=LEVELS, help='Show level factors for this level')
+    parser.add_argument('--category', help='Restrict to one category')
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog()
+    if not args.level:
+        print(f"{len(catalog.products)} products, levels: {', '.join(catalog.levels)}")
+        for category, positions in catalog.by_category.items():
+            print(f"  {category}: {len(positions)}")
+        return
+
+    positions = catalog.by_category.get(args.category, []) if args.category else range(len(catalog.products))
+    column = catalog.level_column(args.level)
+    for i in sorted(positions, key=lambda i: -column[i]):
+        print(f"  {catalog.names[i]:<24} {column[i]:>5.2f}  ${catalog.prices[i]:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Ad-hoc query tool over belProfiles.json, payouts.json and orders.json
+
+Examples:
+    python3 query_bel_data.py payouts --year 2025 --months 7-9 --group-by region --agg sum:netPayout
+    python3 query_bel_data.py metrics --months 3,4,7 --group-by level --agg avg:orders
+    python3 query_bel_data.py orders --cohort 2025 --group-by belId,status --format csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+from bel_dataset import ColumnTable, load_table
+
+AGGREGATES = ('count', 'sum', 'avg', 'min', 'max')
+
+# Metrics whose values are only comparable within one unit (metric -> unit column)
+UNIT_COLUMNS = {'amount': 'currency'}
+
+
+def parse_months(spec: str) -> List[int]:
+    """Parse '3,4,7' or '7-9' (or a mix) into month numbers"""
+    months = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(x) for x in part.split('-', 1))
+            months.update(range(start, end + 1))
+        else:
+            months.add(int(part))
+    invalid = [m for m in months if not 1 <= m <= 12]
+    if invalid:
+        raise ValueError(f"Invalid month(s): {sorted(invalid)}")
+    return sorted(months)
+
+
+def parse_aggregates(specs: Sequence[str], table: ColumnTable,
+                     group_by: Sequence[str] = ()) -> List[Tuple[str, str]]:
+    """Parse 'sum:revenue' style specs into (function, column) pairs"""
+    if not specs:
+        # Default: count plus the sum of every metric that can be summed across the groups
+        return [('count', '')] + [('sum', metric) for metric in table.metrics
+                                  if metric not in UNIT_COLUMNS or UNIT_COLUMNS[metric] in group_by]
+
+    parsed = []
+    for spec in specs:
+        func, _, column = spec.partition(':')
+        if func not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{func}', expected one of {', '.join(AGGREGATES)}")
+        if func != 'count' and column not in table.metrics:
+            raise ValueError(f"Cannot {func} '{column}', numeric columns are: {', '.join(table.metrics)}")
+        parsed.append((func, column if func != 'count' else ''))
+    return parsed
+
+
+def build_filters(args: argparse.Namespace, table: ColumnTable) -> Dict[str, List[Any]]:
+    """Translate CLI options into column -> accepted values filters"""
+    filters: Dict[str, List[Any]] = {}
+    if args.year:
+        filters['year'] = args.year
+    if args.months:
+        filters['month'] = parse_months(args.months)
+    if args.region:
+        filters['region'] = args.region
+    if args.level:
+        filters['level'] = args.level
+    if args.bel:
+        filters['belId'] = args.bel
+    if args.status:
+        filters['status'] = args.status
+    if args.cohort:
+        # A cohort is a join month (YYYY-MM); a bare year selects every month of it
+        known = table.index('cohort').keys()
+        filters['cohort'] = [c for c in known if any(c.startswith(p) for p in args.cohort)]
+    return filters
+
+
+def run_query(table: ColumnTable, filters: Dict[str, List[Any]], group_by: Sequence[str],
+              aggregates: Sequence[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Filter, group and aggregate the table into result rows"""
+    for column in list(filters) + list(group_by):
+        if column not in table.columns:
+            raise ValueError(f"Unknown column: {column}")
+
+    rows = table.select(filters)
+
+    # Refuse to mix units (e.g. order amounts in different currencies) within a group
+    for _, column in aggregates:
+        unit = UNIT_COLUMNS.get(column)
+        if unit and unit in table.columns and unit not in group_by:
+            units = {table.columns[unit][row] for row in rows}
+            if len(units) > 1:
+                raise ValueError(f"'{column}' spans {len(units)} {unit} values; add {unit} to --group-by")
+
+    key_columns = [table.columns[c] for c in group_by]
+    value_columns = {column: table.columns[column] for _, column in aggregates if column}
+
+    # Per group: row count plus running sum/min/max for every aggregated column
+    groups: Dict[Tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(col[row] for col in key_columns)
+        state = groups.get(key)
+        if state is None:
+            state = {'count': 0, 'sum': {}, 'min': {}, 'max': {}}
+            groups[key] = state
+        state['count'] += 1
+        for column, values in value_columns.items():
+            value = values[row]
+            if value is None:
+                continue
+            state['sum'][column] = state['sum'].get(column, 0) + value
+            if column not in state['min'] or value < state['min'][column]:
+                state['min'][column] = value
+            if column not in state['max'] or value > state['max'][column]:
+                state['max'][column] = value
+
+    results = []
+    # Sort on the native values (months 1..12 numerically), None last
+    for key in sorted(groups, key=lambda k: tuple((v is None, v) for v in k)):
+        state = groups[key]
+        result = dict(zip(group_by, key))
+        for func, column in aggregates:
+            if func == 'count':
+                result['count'] = state['count']
+            elif func == 'avg':
+                total = state['sum'].get(column, 0)
+                result[f'avg_{column}'] = round(total / state['count'], 2) if state['count'] else 0
+            else:
+                value = state[func].get(column, 0)
+                result[f'{func}_{column}'] = round(value, 2) if isinstance(value, float) else value
+        results.append(result)
+    return results
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    """Render results as an aligned text table"""
+    if not results:
+        return '(no rows)'
+    headers = list(results[0].keys())
+    cells = [[f"{r[h]:,.2f}" if isinstance(r[h], float) else str(r[h]) for h in headers] for r in results]
+    widths = [max(len(h), *(len(row[i]) for row in cells)) for i, h in enumerate(headers)]
+    lines = ['  '.join(h.ljust(w) for h, w in zip(headers, widths)),
+             '  '.join('-' * w for w in widths)]
+    for row in cells:
+        lines.append('  '.join(c.rjust(w) if i else c.ljust(w) for i, (c, w) in enumerate(zip(row, widths))))
+    return '\n'.join(lines)
+
+
+def write_results(results: List[Dict[str, Any]], fmt: str) -> None:
+    """Write results to stdout in the requested format"""
+    if fmt == 'json':
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    elif fmt == 'csv':
+        if results:
+            writer = csv.DictWriter(sys.stdout, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        print(format_table(results))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Query BEL metrics, payouts and orders')
+    parser.add_argument('table', choices=('metrics', 'payouts', 'orders'),
+                        help='metrics = belProfiles monthlyData, payouts = payouts.json, orders = orders.json')
+    parser.add_argument('--year', type=int, action='append', help='Year filter (repeatable)')
+    parser.add_argument('--months', help="Month numbers, e.g. '7-9' or '3,4,7'")
+    parser.add_argument('--region', action='append', help='Region filter (repeatable)')
+    parser.add_argument('--level', action='append', help='Level filter (repeatable)')
+    parser.add_argument('--cohort', action='append', help='Join cohort YYYY-MM or YYYY (repeatable)')
+    parser.add_argument('--bel', action='append', help='BEL id filter (repeatable)')
+    parser.add_argument('--status', action='append', help='Payout/order status filter (repeatable)')
+    parser.add_argument('--group-by', default='', help='Comma separated columns to group by')
+    parser.add_argument('--agg', action='append', default=[],
+                        help="Aggregate as func:column (count, sum, avg, min, max), repeatable")
+    parser.add_argument('--format', choices=('table', 'csv', 'json'), default='table')
+    args = parser.parse_args(argv)
+
+    table = load_table(args.table)
+    group_by = [c.strip() for c in args.group_by.split(',') if c.strip()]
+    try:
+        aggregates = parse_aggregates(args.agg, table, group_by)
+        results = run_query(table, build_filters(args, table), group_by, aggregates)
+    except ValueError as e:
+        parser.error(str(e))
+
+    write_results(results, args.format)
+
+
+if __name__ == "__main__":
+    main()
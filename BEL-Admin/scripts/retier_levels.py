@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Re-tier BEL levels from rolling 12-month performance.
+
+belProfiles.json monthlyData is laid out as a BEL x month matrix per metric
+(clicks, orders, revenue, plus an active-month indicator) in one pass over the
+metrics table, and each row is turned into prefix sums once. A rolling window
+sum is then two lookups per BEL regardless of window length. The month axis
+is every calendar month from the first to the last month with data, so a
+month no BEL reported still takes a column and a 12-month window always
+spans 12 calendar months.
+
+For each BEL the window ending at the as-of month gives average monthly
+revenue and orders over its active months (months with clicks, so BELs with a
+short history are not penalized) and the window conversion rate. The highest
+level whose thresholds are all met is the new level.
+
+Level changes are appended to belProfiles.deltas.jsonl as set_level
+operations in one all-or-nothing batch, and a change report is printed
+(and written with --report).
+
+Usage:
+    python3 retier_levels.py --dry-run                  # report only
+    python3 retier_levels.py                            # write level changes
+    python3 retier_levels.py --as-of 2025-06 --thresholds thresholds.json --report retier_report.json
+"""
+
+import argparse
+import json
+from datetime import datetime
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Tuple
+
+from bel_dataset import build_metrics_table, data_path, save_json
+from data_deltas import append_ops, load_with_deltas
+from synthetic_data import LEVEL_RANGES, SLOW_MONTHS_FACTOR
+
+WINDOW_MONTHS = 12
+LEVEL_ORDER = ['Leader', 'Exploder', 'Enabler', 'Builder']  # highest first
+METRICS = ('clicks', 'orders', 'revenue')
+
+# Average month factor of the generated data (slow months are scaled down)
+_SEASON_FACTOR = (12 - sum(1 - f for f in SLOW_MONTHS_FACTOR.values())) / 12
+
+# Minimum average monthly revenue / orders over active months, and minimum
+# window conversion rate (%). Derived from the bottom of each level's
+# LEVEL_RANGES so generated data and tiering agree; Builder is the floor.
+DEFAULT_THRESHOLDS: Dict[str, Dict[str, float]] = {
+    level: {
+        'revenue': round(LEVEL_RANGES[level]['revenue'][0] * _SEASON_FACTOR),
+        'orders': round(LEVEL_RANGES[level]['orders'][0] * _SEASON_FACTOR, 1),
+        'conversionRate': round(LEVEL_RANGES[level]['orders'][0] / LEVEL_RANGES[level]['clicks'][1] * 100, 2)
+    }
+    for level in LEVEL_ORDER[:-1]
+}
+
+
+def month_matrix(profiles: Dict[str, Any]) -> Tuple[List[str], List[Tuple[int, int]], Dict[str, List[List[int]]]]:
+    """BEL ids, contiguous (year, month) timeline and BEL x month prefix-sum rows per metric
+
+    The timeline holds every calendar month between the first and last month
+    with data (gaps are zero columns). row[j] is the metric summed over the
+    first j months of the timeline, so every row has len(timeline) + 1 entries.
+    """
+    table = build_metrics_table(profiles)
+    c = table.columns
+    bel_ids = list(dict.fromkeys(c['belId']))
+    timeline = calendar_months(set(zip(c['year'], c['month'])))
+    row_of = {bel_id: i for i, bel_id in enumerate(bel_ids)}
+    col_of = {ym: j for j, ym in enumerate(timeline)}
+
+    matrices = {name: [[0] * len(timeline) for _ in bel_ids] for name in METRICS + ('active',)}
+    rows = map(row_of.__getitem__, c['belId'])
+    cols = map(col_of.__getitem__, zip(c['year'], c['month']))
+    for i, j, clicks, orders, revenue in zip(rows, cols, c['clicks'], c['orders'], c['revenue']):
+        matrices['clicks'][i][j] = clicks
+        matrices['orders'][i][j] = orders
+        matrices['revenue'][i][j] = revenue
+        matrices['active'][i][j] = 1 if clicks > 0 else 0
+    prefixes = {name: [list(accumulate(row, initial=0)) for row in matrix] for name, matrix in matrices.items()}
+    return bel_ids, timeline, prefixes
+
+
+def calendar_months(months) -> List[Tuple[int, int]]:
+    """Every (year, month) from the earliest to the latest of months"""
+    if not months:
+        return []
+    (first_year, first_month), (last_year, last_month) = min(months), max(months)
+    first, last = first_year * 12 + first_month - 1, last_year * 12 + last_month - 1
+    return [(i // 12, i % 12 + 1) for i in range(first, last + 1)]
+
+
+def window_sums(prefixes: List[List[int]], end: int, window: int) -> List[int]:
+    """Sum of months (end - window, end] for every prefix-sum row"""
+    start = max(0, end + 1 - window)
+    return [row[end + 1] - row[start] for row in prefixes]
+
+
+def assign_level(stats: Dict[str, float], thresholds: Dict[str, Dict[str, float]]) -> str:
+    """Highest level whose every threshold is met, Builder otherwise"""
+    for level in LEVEL_ORDER:
+        minimums = thresholds.get(level)
+        if minimums and all(stats.get(metric, 0) >= value for metric, value in minimums.items()):
+            return level
+    return LEVEL_ORDER[-1]
+
+
+def retier(profiles: Dict[str, Any], thresholds: Dict[str, Dict[str, float]],
+           as_of: Optional[Tuple[int, int]] = None, window: int = WINDOW_MONTHS) -> Dict[str, Any]:
+    """Compute rolling stats and the new level of every BEL"""
+    bel_ids, timeline, prefixes = month_matrix(profiles)
+    if not timeline:
+        return {'asOf': None, 'window': window, 'bels': [], 'changes': []}
+
+    if as_of is None:
+        # Latest month in which any BEL had orders
+        order_totals = [sum(col) for col in zip(*prefixes['orders'])]
+        end = max((j for j in range(len(timeline)) if order_totals[j + 1] > order_totals[j]),
+                  default=len(timeline) - 1)
+    elif as_of in timeline:
+        end = timeline.index(as_of)
+    else:
+        raise ValueError(f"No monthlyData for {as_of[0]}-{as_of[1]:02d}")
+
+    sums = {name: window_sums(rows, end, window) for name, rows in prefixes.items()}
+    profiles_by_id = {bel['id']: bel for bel in profiles.get('leaderboard', [])}
+
+    bels = []
+    for i, bel_id in enumerate(bel_ids):
+        active = sums['active'][i]
+        clicks, orders, revenue = sums['clicks'][i], sums['orders'][i], sums['revenue'][i]
+        stats = {
+            'revenue': round(revenue / active) if active else 0,
+            'orders': round(orders / active, 1) if active else 0,
+            'conversionRate': round(orders / clicks * 100, 2) if clicks else 0
+        }
+        bel = profiles_by_id[bel_id]
+        bels.append({
+            'belId': bel_id,
+            'name': bel.get('name', ''),
+            'region': bel.get('region', ''),
+            'activeMonths': active,
+            'windowRevenue': revenue,
+            'windowOrders': orders,
+            'avgMonthlyRevenue': stats['revenue'],
+            'avgMonthlyOrders': stats['orders'],
+            'conversionRate': stats['conversionRate'],
+            'previousLevel': bel.get('level', LEVEL_ORDER[-1]),
+            'level': assign_level(stats, thresholds)
+        })
+
+    year, month = timeline[end]
+    return {
+        'asOf': f"{year}-{month:02d}",
+        'window': window,
+        'bels': bels,
+        'changes': [b for b in bels if b['level'] != b['previousLevel']]
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    print(f"=== Level re-tiering ({result['window']} months to {result['asOf']}) ===")
+    if not result['changes']:
+        print("No level changes")
+        return
+    print(f"{'BEL':<12} {'Name':<22} {'Avg revenue':>12} {'Avg orders':>10} {'CVR %':>6}  Change")
+    for b in result['changes']:
+        previous_rank = LEVEL_ORDER.index(b['previousLevel']) if b['previousLevel'] in LEVEL_ORDER else len(LEVEL_ORDER)
+        direction = '↑' if LEVEL_ORDER.index(b['level']) < previous_rank else '↓'
+        print(f"{b['belId']:<12} {b['name'][:22]:<22} {b['avgMonthlyRevenue']:>12,} {b['avgMonthlyOrders']:>10} "
+              f"{b['conversionRate']:>6}  {b['previousLevel']} → {b['level']} {direction}")
+    print(f"\n{len(result['changes'])} of {len(result['bels'])} BELs change level")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Re-tier BEL levels from rolling performance')
+    parser.add_argument('--as-of', metavar='YYYY-MM', help='Last month of the window (default: latest month with orders)')
+    parser.add_argument('--window', type=int, default=WINDOW_MONTHS, help=f'Window length in months (default {WINDOW_MONTHS})')
+    parser.add_argument('--thresholds', help='JSON file {level: {revenue, orders, conversionRate}} overriding the defaults')
+    parser.add_argument('--report', help='Also write the full report to this JSON file (under data/)')
+    parser.add_argument('--dry-run', action='store_true', help='Print the report without writing level changes')
+    args = parser.parse_args(argv)
+
+    as_of = None
+    if args.as_of:
+        try:
+            as_of = (int(args.as_of[:4]), int(args.as_of[5:7]))
+        except ValueError:
+            parser.error('--as-of must look like YYYY-MM')
+
+    thresholds = DEFAULT_THRESHOLDS
+    if args.thresholds:
+        with open(args.thresholds, 'r', encoding='utf-8') as f:
+            thresholds = json.load(f)
+
+    profiles = load_with_deltas('belProfiles.json')
+    try:
+        result = retier(profiles, thresholds, as_of, args.window)
+    except ValueError as e:
+        parser.error(str(e))
+    print_report(result)
+
+    if args.report:
+        save_json(dict(result, generatedAt=datetime.now().strftime('%Y-%m-%d %H:%M:%S'), thresholds=thresholds),
+                  args.report)
+        print(f"Report -> {data_path(args.report)}")
+
+    if args.dry_run or not result['changes']:
+        return
+    written = append_ops('belProfiles.json', [
+        {'op': 'set_level', 'belId': b['belId'], 'level': b['level'], 'previous': b['previousLevel'],
+         'asOf': result['asOf']}
+        for b in result['changes']
+    ])
+    print(f"✅ {written} level changes written to belProfiles.deltas.jsonl")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Local data server for the BEL portals (replaces `python -m http.server`).
+
+Serves the portal pages (top-level .html files and the STATIC_DIRS folders;
+never dotfiles such as .git) as static files, with extra handling for the
+JSON files under BEL-Admin/data and BEL-UserPortal-A/data:
+- files are parsed, change logs applied (see data_deltas.py) and re-serialized
+  compactly once, then kept in an in-memory LRU keyed by file version
+- strong ETags, one per content encoding ("<sha1>", "<sha1>-gzip",
+  "<sha1>-br"), with If-None-Match (including *) -> 304 Not Modified
+- gzip (and br when the optional `brotli` package is installed) negotiation
+- parsing, change-log application, serialization, index refreshes and
+  compression run on a worker thread, so the event loop only does socket I/O
+
+Query endpoints backed by an in-memory index:
+    GET /api/bels/<belId>                          profile, payouts and orders of one BEL
+    GET /api/slice?year=2025&region=Europe&level=  one year (optionally region/level) slice
+
+Usage:
+    python3 serve_data.py --port 8000
+    open http://localhost:8000/BEL-Admin/
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from bel_dataset import DATA_DIR, MONTH_NAMES
+from data_deltas import COMPACTING_SUFFIX, DELTA_FILES, delta_path, load_with_deltas
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+ROOT_DIR = os.path.normpath(os.path.join(DATA_DIR, '..', '..'))
+# Top-level folders served as static files, besides the top-level .html pages
+STATIC_DIRS = ('BEL-Admin', 'BEL-Login', 'BEL-UserPortal-A', 'component-library')
+JSON_DIRS = (
+    DATA_DIR,
+    os.path.join(ROOT_DIR, 'BEL-UserPortal-A', 'data'),
+)
+
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+COMPRESSIBLE = ('application/json', 'text/', 'application/javascript', 'image/svg+xml')
+MIN_COMPRESS_SIZE = 512
+
+
+class Resource:
+    """Serialized response body with its ETags and lazily built encodings"""
+
+    def __init__(self, body: bytes, content_type: str):
+        self.content_type = content_type
+        self.digest = hashlib.sha1(body).hexdigest()
+        self.encodings: Dict[str, bytes] = {'identity': body}
+
+    def etag(self, encoding: str) -> str:
+        """Strong ETag of one representation (each encoding has different bytes)"""
+        if encoding == 'identity':
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def encoded(self, encoding: str) -> bytes:
+        if encoding not in self.encodings:
+            body = self.encodings['identity']
+            if encoding == 'br':
+                self.encodings[encoding] = brotli.compress(body)
+            else:
+                self.encodings[encoding] = gzip.compress(body, compresslevel=6)
+        return self.encodings[encoding]
+
+    @property
+    def size(self) -> int:
+        return sum(len(b) for b in self.encodings.values())
+
+
+class LRUCache:
+    """Byte-bounded LRU of resources keyed by (path, version)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries: 'OrderedDict[Tuple, Resource]' = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[Resource]:
+        resource = self.entries.get(key)
+        if resource is not None:
+            self.entries.move_to_end(key)
+        return resource
+
+    def put(self, key: Tuple, resource: Resource) -> None:
+        # Older versions of the same path are never requested again
+        for stale in [k for k in self.entries if k[0] == key[0]]:
+            del self.entries[stale]
+        self.entries[key] = resource
+        self.trim()
+
+    def trim(self) -> None:
+        total = sum(r.size for r in self.entries.values())
+        while total > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            total -= evicted.size
+
+
+def file_version(path: str) -> Tuple:
+    """Version stamp of a file and, for BEL-Admin data, its change log"""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    filename = os.path.basename(path)
+    if os.path.dirname(path) == DATA_DIR and filename in DELTA_FILES:
+        for log_path in (delta_path(filename) + COMPACTING_SUFFIX, delta_path(filename)):
+            try:
+                log = os.stat(log_path)
+                version += (log.st_mtime_ns, log.st_size)
+            except FileNotFoundError:
+                version += (None, None)
+    return version
+
+
+def serialize(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class DataIndex:
+    """BEL id / region / level lookups over profiles, payouts and orders"""
+
+    def __init__(self):
+        self.version: Optional[Tuple] = None
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.payouts: Dict[str, List[Dict[str, Any]]] = {}
+        self.orders: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_region: Dict[str, List[str]] = {}
+        self.by_level: Dict[str, List[str]] = {}
+
+    def refresh(self) -> None:
+        version = tuple(file_version(os.path.join(DATA_DIR, f))
+                        for f in ('belProfiles.json', 'payouts.json', 'orders.json'))
+        if version == self.version:
+            return
+        profiles = load_with_deltas('belProfiles.json').get('leaderboard', [])
+        self.profiles = {bel['id']: bel for bel in profiles}
+        self.by_region, self.by_level = {}, {}
+        for bel in profiles:
+            self.by_region.setdefault(bel.get('region', 'Others'), []).append(bel['id'])
+            self.by_level.setdefault(bel.get('level', 'Unknown'), []).append(bel['id'])
+        self.payouts = {entry['belId']: entry.get('payoutHistory', [])
+                        for entry in load_with_deltas('payouts.json').get('belPayoutHistory', [])}
+        self.orders = {}
+        for order in load_with_deltas('orders.json').get('history', []):
+            self.orders.setdefault(order.get('referralId'), []).append(order)
+        self.version = version
+
+    def bel(self, bel_id: str) -> Optional[Dict[str, Any]]:
+        profile = self.profiles.get(bel_id)
+        if profile is None:
+            return None
+        return {
+            'profile': profile,
+            'payouts': self.payouts.get(bel_id, []),
+            'orders': self.orders.get(bel_id, []),
+        }
+
+    def slice(self, year: str, region: Optional[str], level: Optional[str]) -> Dict[str, Any]:
+        ids = set(self.profiles)
+        if region:
+            ids &= set(self.by_region.get(region, ()))
+        if level:
+            ids &= set(self.by_level.get(level, ()))
+        bels = []
+        for bel_id in sorted(ids):
+            bel = self.profiles[bel_id]
+            year_data = bel.get('monthlyData', {}).get(year, {})
+            bels.append({
+                'id': bel_id,
+                'name': bel.get('name'),
+                'level': bel.get('level'),
+                'region': bel.get('region'),
+                'accountCreatedDate': bel.get('accountCreatedDate'),
+                'monthlyData': {m: year_data[m] for m in MONTH_NAMES if m in year_data},
+                'payoutHistory': [p for p in self.payouts.get(bel_id, []) if str(p.get('year')) == year],
+            })
+        return {'year': year, 'region': region, 'level': level, 'bels': bels}
+
+
+class DataServer:
+    def __init__(self, cache_bytes: int = 64 * 1024 * 1024):
+        self.cache = LRUCache(cache_bytes)
+        self.index = DataIndex()
+        # One worker: the cache and index are only touched from this thread
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    # --- resources ---
+
+    def static_resource(self, url_path: str) -> Optional[Resource]:
+        parts = [part for part in unquote(url_path).split('/') if part]
+        # No dot segments ('..', .git, .DS_Store) and nothing outside the portal pages
+        if any(part.startswith('.') for part in parts):
+            return None
+        if parts and not (parts[0] in STATIC_DIRS or (len(parts) == 1 and parts[0].endswith('.html'))):
+            return None
+        path = os.path.normpath(os.path.join(ROOT_DIR, *parts))
+        if not (path == ROOT_DIR or path.startswith(ROOT_DIR + os.sep)):
+            return None
+        if os.path.isdir(path):
+            path = os.path.join(path, 'index.html')
+        if not os.path.isfile(path):
+            return None
+
+        key = (path, file_version(path))
+        resource = self.cache.get(key)
+        if resource is None:
+            if path.endswith('.json') and os.path.dirname(path).startswith(JSON_DIRS):
+                resource = Resource(self.json_body(path), 'application/json; charset=utf-8')
+            else:
+                with open(path, 'rb') as f:
+                    body = f.read()
+                content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+                if content_type.startswith('text/') or content_type == 'application/javascript':
+                    content_type += '; charset=utf-8'
+                resource = Resource(body, content_type)
+            self.cache.put(key, resource)
+        return resource
+
+    @staticmethod
+    def json_body(path: str) -> bytes:
+        filename = os.path.basename(path)
+        if os.path.dirname(path) == DATA_DIR:
+            return serialize(load_with_deltas(filename))
+        with open(path, 'r', encoding='utf-8') as f:
+            return serialize(json.load(f))
+
+    def api_resource(self, url_path: str, query: Dict[str, List[str]]) -> Tuple[int, Resource]:
+        self.index.refresh()
+        key = (url_path + '?' + json.dumps(sorted(query.items())), self.index.version)
+        resource = self.cache.get(key)
+        if resource is not None:
+            return 200, resource
+
+        parts = url_path.strip('/').split('/')
+        if len(parts) == 3 and parts[1] == 'bels':
+            data = self.index.bel(parts[2])
+            if data is None:
+                return 404, Resource(serialize({'error': f'BEL {parts[2]} not found'}), 'application/json')
+        elif parts == ['api', 'slice']:
+            year = query.get('year', [''])[0]
+            if not year.isdigit():
+                return 400, Resource(serialize({'error': 'year is required'}), 'application/json')
+            data = self.index.slice(year, query.get('region', [None])[0], query.get('level', [None])[0])
+        else:
+            return 404, Resource(serialize({'error': 'Unknown endpoint'}), 'application/json')
+
+        resource = Resource(serialize(data), 'application/json; charset=utf-8')
+        self.cache.put(key, resource)
+        return 200, resource
+
+    def resolve(self, path: str, query: str, headers: Dict[str, str]) -> Tuple[int, Optional[Resource], str]:
+        """Status, resource and content encoding of a GET (runs on the worker thread)"""
+        if path.startswith('/api/'):
+            status, resource = self.api_resource(path, parse_qs(query))
+        else:
+            resource = self.static_resource(path)
+            status = 200 if resource else 404
+        encoding = 'identity'
+        if resource is not None:
+            encoding = self.pick_encoding(headers.get('accept-encoding', ''), resource)
+        if status == 200 and self.none_match(headers.get('if-none-match'), resource.etag(encoding)):
+            return 304, resource, encoding
+        if resource is not None:
+            resource.encoded(encoding)
+        return status, resource, encoding
+
+    # --- HTTP ---
+
+    @staticmethod
+    def none_match(header: Optional[str], etag: str) -> bool:
+        """True when If-None-Match lists etag or is * (weak comparison, W/ ignored)"""
+        if header is None:
+            return False
+        if header.strip() == '*':
+            return True
+        tags = (tag.strip() for tag in header.split(','))
+        return any((tag[2:] if tag.startswith('W/') else tag) == etag for tag in tags)
+
+    @staticmethod
+    def pick_encoding(accept: str, resource: Resource) -> str:
+        if not resource.content_type.startswith(COMPRESSIBLE):
+            return 'identity'
+        if len(resource.encodings['identity']) < MIN_COMPRESS_SIZE:
+            return 'identity'
+        offered = {token.split(';')[0].strip() for token in accept.split(',')}
+        if brotli is not None and 'br' in offered:
+            return 'br'
+        if 'gzip' in offered:
+            return 'gzip'
+        return 'identity'
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.respond(writer, 400, None, 'identity', close=True)
+                    break
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+                await self.dispatch(writer, method, target, headers, close)
+                if close:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, writer, method: str, target: str, headers: Dict[str, str], close: bool) -> None:
+        if method not in ('GET', 'HEAD'):
+            await self.respond(writer, 405, None, 'identity', close)
+            return
+        url = urlsplit(target)
+        loop = asyncio.get_running_loop()
+        try:
+            status, resource, encoding = await loop.run_in_executor(
+                self.executor, self.resolve, url.path, url.query, headers)
+        except Exception as e:
+            print(f"500 {target}: {e}")
+            status, resource, encoding = 500, None, 'identity'
+
+        await self.respond(writer, status, resource, encoding, close, head=method == 'HEAD')
+        print(f"{status} {method} {target}")
+
+    async def respond(self, writer, status: int, resource: Optional[Resource], encoding: str,
+                      close: bool, head: bool = False) -> None:
+        out = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}"]
+        body = b''
+        if resource is not None:
+            out.append(f"ETag: {resource.etag(encoding)}")
+            out.append("Cache-Control: no-cache")
+            out.append("Vary: Accept-Encoding")
+            if status != 304:
+                body = resource.encodings[encoding]
+                out.append(f"Content-Type: {resource.content_type}")
+                if encoding != 'identity':
+                    out.append(f"Content-Encoding: {encoding}")
+        out.append(f"Content-Length: {len(body)}")
+        out.append("Connection: close" if close else "Connection: keep-alive")
+        writer.write(('\r\n'.join(out) + '\r\n\r\n').encode('latin-1'))
+        if not head:
+            writer.write(body)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, cache_bytes: int) -> None:
+    server = DataServer(cache_bytes)
+    listener = await asyncio.start_server(server.handle, host, port)
+    print(f"Serving {ROOT_DIR} on http://{host}:{port}/ (Ctrl+C to stop)")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve the BEL portals and their data files')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--cache-mb', type=int, default=64, help='In-memory cache size in MB')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_mb * 1024 * 1024))
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
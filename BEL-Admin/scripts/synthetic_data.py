@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic data generation for BEL profiles and payouts.
+
+Every BEL draws from its own random stream, seeded from the master seed, the
+BEL id and the purpose of the draw (monthly metrics, join date, payout). The
+output for one BEL therefore never depends on which other BELs are generated
+or in what order, so generation can be sharded across processes and still
+produce identical results for any worker count.
+"""
+
+import hashlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Sequence
+
+DEFAULT_SEED = 20250912
+
+# 各級別的基礎數據範圍
+LEVEL_RANGES = {
+    "Leader": {
+        "clicks": (800, 1200),
+        "orders": (25, 40),
+        "revenue": (20000, 35000)
+    },
+    "Exploder": {
+        "clicks": (500, 800),
+        "orders": (15, 25),
+        "revenue": (12000, 20000)
+    },
+    "Enabler": {
+        "clicks": (300, 500),
+        "orders": (8, 15),
+        "revenue": (6000, 12000)
+    },
+    "Builder": {
+        "clicks": (150, 300),
+        "orders": (4, 8),
+        "revenue": (3000, 6000)
+    }
+}
+
+# 淡季月份調降係數
+SLOW_MONTHS_FACTOR = {
+    "March": 0.7,    # 3月調降30%
+    "April": 0.75,   # 4月調降25%
+    "July": 0.8      # 7月調降20%
+}
+
+# 級別係數 - 不同級別的Payout表現差異
+LEVEL_PAYOUT_MULTIPLIERS = {
+    'Leader': (1.05, 1.15),     # Leader級別表現較好
+    'Exploder': (0.95, 1.10),  # Exploder級別中等表現
+    'Enabler': (0.85, 1.05),   # Enabler級別穩定表現
+    'Builder': (0.80, 1.00),   # Builder級別基礎表現
+    'Explorer': (0.75, 0.95)   # Explorer級別較低表現
+}
+
+
+def bel_rng(master_seed: int, bel_id: str, stream: str) -> random.Random:
+    """Return the independent random stream for one BEL and purpose"""
+    digest = hashlib.sha256(f"{master_seed}:{bel_id}:{stream}".encode('utf-8')).digest()
+    return random.Random(int.from_bytes(digest[:8], 'big'))
+
+
+def generate_monthly_data(level: str, month: str, base_factor: float = 1.0, rng=random) -> Dict[str, int]:
+    """根據級別和月份生成數據"""
+    ranges = LEVEL_RANGES.get(level, LEVEL_RANGES["Builder"])
+
+    # 應用淡季調降係數
+    month_factor = SLOW_MONTHS_FACTOR.get(month, 1.0)
+    total_factor = base_factor * month_factor
+
+    clicks = int(rng.randint(ranges["clicks"][0], ranges["clicks"][1]) * total_factor)
+    orders = int(rng.randint(ranges["orders"][0], ranges["orders"][1]) * total_factor)
+    revenue = int(rng.randint(ranges["revenue"][0], ranges["revenue"][1]) * total_factor)
+
+    return {
+        "clicks": clicks,
+        "orders": orders,
+        "revenue": revenue
+    }
+
+
+def generate_monthly_batch(level: str, months: Sequence[str], rng, base_factor: float = 1.0) -> Dict[str, Dict[str, int]]:
+    """Draw the metrics of several months for one BEL from one stream"""
+    return {month: generate_monthly_data(level, month, base_factor, rng) for month in months}
+
+
+def generate_random_date(start_date: datetime, end_date: datetime, rng=random) -> datetime:
+    """Generate a random date between start_date and end_date"""
+    days_between = (end_date - start_date).days
+    return start_date + timedelta(days=rng.randrange(days_between))
+
+
+def calculate_september_payout(bel_id: str, august_data: Dict, bel_level: str, rng=random) -> Dict[str, Any]:
+    """根據8月數據和BEL級別計算9月的payout數據"""
+    # 獲取級別係數範圍，如果級別未知使用默認值
+    min_mult, max_mult = LEVEL_PAYOUT_MULTIPLIERS.get(bel_level, (0.85, 1.05))
+
+    # 9月份通常是旺季開始，基礎增長係數
+    september_factor = rng.uniform(1.02, 1.12)
+
+    # 級別隨機係數
+    level_factor = rng.uniform(min_mult, max_mult)
+
+    # 總體係數
+    total_factor = september_factor * level_factor
+
+    # 基於8月數據計算9月數據
+    august_gross = august_data.get('grossPayout', 1000.0)
+
+    # 計算9月的gross payout
+    september_gross = round(august_gross * total_factor, 2)
+
+    # WHT通常是gross payout的20%
+    september_wht = round(september_gross * 0.20, 2)
+
+    # Net payout = gross - wht
+    september_net = round(september_gross - september_wht, 2)
+
+    # 生成唯一的payout ID
+    payout_id = f"PO-2025-{bel_id[-3:]}-09"
+
+    return {
+        "payoutId": payout_id,
+        "year": 2025,
+        "month": 9,
+        "date": "2025-09-12",
+        "grossPayout": september_gross,
+        "wht": september_wht,
+        "netPayout": september_net,
+        "status": "Completed"
+    }
+
+
+# --- Per-BEL jobs (module level so worker processes can import them) ---
+
+def draw_monthly_job(master_seed: int, job: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """job = {'id', 'level', 'months': {year: [month, ...]}} -> {year: {month: metrics}}"""
+    result = {}
+    for year, months in job['months'].items():
+        rng = bel_rng(master_seed, job['id'], f"monthly:{year}")
+        result[year] = generate_monthly_batch(job['level'], months, rng)
+    return result
+
+
+def draw_join_date_job(master_seed: int, job: Dict[str, Any]) -> str:
+    """job = {'id', 'start': 'YYYY-MM-DD', 'end': 'YYYY-MM-DD'} -> 'YYYY-MM-DD'"""
+    rng = bel_rng(master_seed, job['id'], 'accountCreatedDate')
+    start = datetime.strptime(job['start'], '%Y-%m-%d')
+    end = datetime.strptime(job['end'], '%Y-%m-%d')
+    return generate_random_date(start, end, rng).strftime('%Y-%m-%d')
+
+
+def draw_september_payout_job(master_seed: int, job: Dict[str, Any]) -> Dict[str, Any]:
+    """job = {'id', 'level', 'base': payout record} -> September 2025 payout record"""
+    rng = bel_rng(master_seed, job['id'], 'payout:2025-09')
+    return calculate_september_payout(job['id'], job['base'], job['level'], rng)
+
+
+def _run_shard(func: Callable, master_seed: int, shard: List[Any]) -> List[Any]:
+    return [func(master_seed, job) for job in shard]
+
+
+def run_sharded(func: Callable, jobs: Iterable[Any], master_seed: int = DEFAULT_SEED,
+                workers: int = 1, shard_size: int = 1000) -> List[Any]:
+    """Apply func(master_seed, job) to every job, in job order.
+
+    With workers > 1 the jobs are split into contiguous shards and processed
+    in a process pool. Because every job seeds its own streams, the result is
+    the same for any worker count or shard size.
+    """
+    jobs = list(jobs)
+    if workers <= 1 or len(jobs) <= shard_size:
+        return _run_shard(func, master_seed, jobs)
+
+    shards = [jobs[i:i + shard_size] for i in range(0, len(jobs), shard_size)]
+    results: List[Any] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard_result in pool.map(partial(_run_shard, func, master_seed), shards):
+            results.extend(shard_result)
+    return results
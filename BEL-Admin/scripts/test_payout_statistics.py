@@ -4,18 +4,15 @@
 檢查9月和8月的數據是否能正確被系統讀取和統計
 """
 
-import json
+from data_deltas import load_with_deltas
 from datetime import datetime
 
 def test_payout_statistics():
     """測試payout統計計算"""
     
     # 載入數據
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/payouts.json', 'r', encoding='utf-8') as f:
-        payout_data = json.load(f)
-    
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-        bel_profiles = json.load(f)
+    payout_data = load_with_deltas('payouts.json')
+    bel_profiles = load_with_deltas('belProfiles.json')
     
     print("=== Payout統計數據測試 ===\n")
     
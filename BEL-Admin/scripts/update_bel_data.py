@@ -6,69 +6,20 @@
 3. 調降3、4、7月的數據營造淡旺季差別
 """
 
-import json
-import random
-from typing import Dict, Any
+import argparse
 
-# 各級別的基礎數據範圍
-LEVEL_RANGES = {
-    "Leader": {
-        "clicks": (800, 1200),
-        "orders": (25, 40),
-        "revenue": (20000, 35000)
-    },
-    "Exploder": {
-        "clicks": (500, 800),
-        "orders": (15, 25),
-        "revenue": (12000, 20000)
-    },
-    "Enabler": {
-        "clicks": (300, 500),
-        "orders": (8, 15),
-        "revenue": (6000, 12000)
-    },
-    "Builder": {
-        "clicks": (150, 300),
-        "orders": (4, 8),
-        "revenue": (3000, 6000)
-    }
-}
+from data_deltas import append_ops, load_with_deltas
+from synthetic_data import DEFAULT_SEED, draw_monthly_job, run_sharded
 
-# 淡季月份調降係數
-SLOW_MONTHS_FACTOR = {
-    "March": 0.7,    # 3月調降30%
-    "April": 0.75,   # 4月調降25%
-    "July": 0.8      # 7月調降20%
-}
-
-def generate_monthly_data(level: str, month: str, base_factor: float = 1.0) -> Dict[str, int]:
-    """根據級別和月份生成數據"""
-    ranges = LEVEL_RANGES.get(level, LEVEL_RANGES["Builder"])
-    
-    # 應用淡季調降係數
-    month_factor = SLOW_MONTHS_FACTOR.get(month, 1.0)
-    total_factor = base_factor * month_factor
-    
-    clicks = int(random.randint(ranges["clicks"][0], ranges["clicks"][1]) * total_factor)
-    orders = int(random.randint(ranges["orders"][0], ranges["orders"][1]) * total_factor)
-    revenue = int(random.randint(ranges["revenue"][0], ranges["revenue"][1]) * total_factor)
-    
-    return {
-        "clicks": clicks,
-        "orders": orders,
-        "revenue": revenue
-    }
-
-def update_bel_profiles():
+def update_bel_profiles(master_seed: int = DEFAULT_SEED, workers: int = 1):
     """更新BEL資料"""
     # 讀取現有資料
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_with_deltas('belProfiles.json')
     
     updated_count = 0
+    jobs = []
     
     for bel in data["leaderboard"]:
-        level = bel["level"]
         monthly_data = bel.get("monthlyData", {})
         
         # 確保有2024和2025年的數據結構
@@ -77,11 +28,11 @@ def update_bel_profiles():
         if "2025" not in monthly_data:
             monthly_data["2025"] = {}
         
-        # 更新2024年的淡季月份數據
-        for month in ["March", "April", "July"]:
-            if month in monthly_data["2024"]:
-                # 重新生成調降後的數據
-                monthly_data["2024"][month] = generate_monthly_data(level, month)
+        # 更新2024與2025年已存在的淡季月份數據
+        months = {
+            year: [month for month in ["March", "April", "July"] if month in monthly_data[year]]
+            for year in ["2024", "2025"]
+        }
         
         # 確保2025年有9月數據（包括檢查是否為空數據）
         september_data = monthly_data.get("2025", {}).get("September", {})
@@ -89,19 +40,24 @@ def update_bel_profiles():
             september_data.get("clicks", 0) == 0 and 
             september_data.get("orders", 0) == 0 and 
             september_data.get("revenue", 0) == 0):
-            monthly_data["2025"]["September"] = generate_monthly_data(level, "September")
+            months["2025"].append("September")
             updated_count += 1
         
-        # 更新2025年的淡季月份數據
-        for month in ["March", "April", "July"]:
-            if month in monthly_data["2025"]:
-                monthly_data["2025"][month] = generate_monthly_data(level, month)
-        
         bel["monthlyData"] = monthly_data
+        jobs.append({"id": bel["id"], "level": bel["level"], "months": months})
+    
+    # 每個BEL使用獨立的亂數串流，結果與worker數量無關
+    generated = run_sharded(draw_monthly_job, jobs, master_seed, workers)
+    ops = []
+    for bel, bel_months in zip(data["leaderboard"], generated):
+        for year, months in bel_months.items():
+            bel["monthlyData"][year].update(months)
+            for month, values in months.items():
+                ops.append({"op": "set_metric", "belId": bel["id"], "year": year, "month": month, "values": values})
     
-    # 寫回文件
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # 寫入變更紀錄（由 data_deltas.py compact 合併回 belProfiles.json）
+    append_ops("belProfiles.json", ops)
+    print(f"已寫入 {len(ops)} 筆變更紀錄")
     
     print(f"已更新 {updated_count} 個BEL的9月數據")
     print("已調降所有BEL的3、4、7月數據以營造淡旺季差別")
@@ -117,4 +73,8 @@ def update_bel_profiles():
         print(f"  {level}: {count} 個BEL")
 
 if __name__ == "__main__":
-    update_bel_profiles()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="更新BEL月度數據")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="主亂數種子")
+    parser.add_argument("--workers", type=int, default=1, help="平行處理的process數量")
+    args = parser.parse_args()
+    update_bel_profiles(args.seed, args.workers)
\ No newline at end of file
@@ -3,13 +3,12 @@
 驗證BEL數據更新效果的腳本
 """
 
-import json
+from data_deltas import load_with_deltas
 
 def validate_updates():
     """驗證數據更新效果"""
     
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_with_deltas('belProfiles.json')
     
     print("=== BEL數據更新驗證報告 ===\n")
     
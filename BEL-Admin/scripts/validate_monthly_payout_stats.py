@@ -4,18 +4,16 @@
 檢查每個月的數據是否與實際payout記錄一致
 """
 
-import json
-from datetime import datetime
+from bel_cohorts import CohortIndex
+from data_deltas import load_with_deltas
 
 def validate_monthly_payout_statistics():
     """驗證2025年每個月的payout統計"""
     
     # 載入數據
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/payouts.json', 'r', encoding='utf-8') as f:
-        payout_data = json.load(f)
-    
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json', 'r', encoding='utf-8') as f:
-        bel_profiles = json.load(f)
+    payout_data = load_with_deltas('payouts.json')
+    bel_profiles = load_with_deltas('belProfiles.json')
+    cohort_index = CohortIndex(bel_profiles.get('leaderboard', []))
     
     print("=== 2025年月度Payout統計驗證 ===\n")
     
@@ -31,7 +29,7 @@ def validate_monthly_payout_statistics():
         month_name = month_names[month_num - 1]
         
         # 計算該月的payout統計
-        stats = calculate_month_stats_corrected(payout_data, bel_profiles, 2025, month_num)
+        stats = calculate_month_stats_corrected(payout_data, bel_profiles, 2025, month_num, cohort_index)
         monthly_stats.append({
             'month': month_name,
             'month_num': month_num,
@@ -81,7 +79,7 @@ def validate_monthly_payout_statistics():
             cumulative_payout += month_data['stats']['totalPayoutAmount']
             print(f"{month_data['month']:>12}: 月度=${month_data['stats']['totalPayoutAmount']:>10,.2f}, 累計=${cumulative_payout:>12,.2f}")
 
-def calculate_month_stats_corrected(payout_data, bel_profiles, year, month):
+def calculate_month_stats_corrected(payout_data, bel_profiles, year, month, cohort_index=None):
     """使用修正後的邏輯計算月度統計（模擬前端修正後的計算）"""
     
     total_payout_amount = 0
@@ -113,14 +111,10 @@ def calculate_month_stats_corrected(payout_data, bel_profiles, year, month):
         if month_data and month_data.get('orders'):
             total_order_count += month_data.get('orders', 0)
     
-    # 計算BEL count（基於account creation date）
-    active_bel_count = 0
-    target_date = f"{year}-{month:02d}-31"  # 月末日期
-    
-    for leader in bel_profiles.get('leaderboard', []):
-        creation_date = leader.get('accountCreatedDate')
-        if creation_date and creation_date <= target_date:
-            active_bel_count += 1
+    # 計算BEL count（基於account creation date，月底前加入者，二分搜尋）
+    if cohort_index is None:
+        cohort_index = CohortIndex(bel_profiles.get('leaderboard', []))
+    active_bel_count = cohort_index.active_at(year, month)
     
     return {
         'totalPayoutAmount': total_payout_amount,
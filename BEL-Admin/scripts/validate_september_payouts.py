@@ -4,15 +4,14 @@
 檢查所有BEL是否都有完整的2025年9月payout數據
 """
 
-import json
-from datetime import datetime
+from data_deltas import load_with_deltas
+from data_schema import validate
 
 def validate_september_payouts():
     """驗證2025年9月的payout數據完整性"""
     
     # 載入payout數據
-    with open('/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/payouts.json', 'r', encoding='utf-8') as f:
-        payout_data = json.load(f)
+    payout_data = load_with_deltas('payouts.json')
     
     print("=== 2025年9月Payout數據驗證 ===\n")
     
@@ -25,12 +24,12 @@ def validate_september_payouts():
     invalid_data = []
     
     for bel_entry in payout_data['belPayoutHistory']:
-        bel_id = bel_entry['belId']
+        bel_id = bel_entry.get('belId', '?')
         
-        # 檢查是否有2025年9月的數據
+        # 檢查是否有2025年9月的數據（其他月份的記錄不影響9月的檢查）
         september_payouts = [
-            payout for payout in bel_entry['payoutHistory']
-            if payout.get('year') == 2025 and payout.get('month') == 9
+            payout for payout in bel_entry.get('payoutHistory', [])
+            if isinstance(payout, dict) and payout.get('year') == 2025 and payout.get('month') == 9
         ]
         
         if not september_payouts:
@@ -45,12 +44,10 @@ def validate_september_payouts():
         september_payout = september_payouts[0]
         bels_with_september += 1
         
-        # 驗證數據完整性
-        required_fields = ['payoutId', 'date', 'grossPayout', 'wht', 'netPayout', 'status']
-        missing_fields = [field for field in required_fields if field not in september_payout]
-        
-        if missing_fields:
-            invalid_data.append(f"{bel_id}: 缺少字段 {missing_fields}")
+        # 結構驗證（data_schema.py 的 payout 記錄 schema，列出所有錯誤與路徑）
+        schema_errors = validate(september_payout, 'payoutRecord')
+        if schema_errors:
+            invalid_data.extend(f"{bel_id}: 9月記錄 {error}" for error in schema_errors)
             continue
         
         # 驗證日期格式
@@ -3,15 +3,14 @@
 Verify that BEL data matches their account creation dates
 """
 
-import json
 from datetime import datetime
 
+from data_deltas import load_with_deltas
+from data_schema import validate
+
 def verify_data():
     """Verify BEL data consistency"""
-    filepath = '/Users/abbydong/Documents/GitHub/BEL-PortalALL2/BEL-Admin/data/belProfiles.json'
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_with_deltas('belProfiles.json')
     
     month_mapping = {
         'January': 1, 'February': 2, 'March': 3, 'April': 4,
@@ -22,8 +21,10 @@ def verify_data():
     issues = []
     
     for bel in data['leaderboard']:
-        if 'accountCreatedDate' not in bel:
-            issues.append(f"{bel['name']}: Missing accountCreatedDate")
+        # Structure of the fields checked below (date format, month names, metric types)
+        schema_errors = validate(bel, 'profileJoinDate')
+        if schema_errors:
+            issues.extend(f"{bel.get('name', bel.get('id', '?'))}: {error}" for error in schema_errors)
             continue
             
         account_date = datetime.strptime(bel['accountCreatedDate'], '%Y-%m-%d')
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Watch BEL-Admin/data and rebuild only the derived outputs affected by a change.
+
+Each derived output declares which dataConfig.json entries (by name) it is
+built from. When a data file or its change log is written, the watcher waits
+for the burst of writes to settle, then rebuilds just the outputs that depend
+on the changed entries and reports how long that took.
+
+Usage:
+    python3 watch_data.py            # watch until Ctrl+C
+    python3 watch_data.py --once     # rebuild every output once and exit
+"""
+
+import argparse
+import importlib
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from bel_dataset import DATA_DIR, load_json
+from product_catalog import load_catalog
+
+# Output name -> (dataConfig names it is built from, "module:function" builder, file it writes).
+# Builders are called without arguments and write their output into the data directory.
+DERIVED_OUTPUTS: Dict[str, Tuple[Tuple[str, ...], str, str]] = {
+    'customerInsights': (('orders', 'belProfiles', 'productCatalog'), 'build_customer_insights:build',
+                         'customerInsights.json'),
+    'productAnalysis': (('belProfiles', 'productCatalog'), 'build_product_analysis:build', 'dashboard.json'),
+    'supportSummary': (('contactSupport',), 'build_support_summary:build', 'supportSummary.json'),
+    'belCohorts': (('belProfiles',), 'bel_cohorts:build', 'belCohorts.json'),
+}
+
+
+def config_file_map() -> Dict[str, str]:
+    """Map data file names (base and change log) to their dataConfig name
+
+    Files written by the builders are left out, so a rebuild does not trigger
+    another change cycle.
+    """
+    outputs = {output for _, _, output in DERIVED_OUTPUTS.values()}
+    mapping = {'dataConfig.json': 'dataConfig'}
+    for entry in load_json('dataConfig.json').get('dataFiles', []):
+        if entry['file'] in outputs:
+            continue
+        mapping[entry['file']] = entry['name']
+        if entry.get('deltas'):
+            mapping[entry['deltas']] = entry['name']
+    return mapping
+
+
+def affected_outputs(changed: Iterable[str]) -> List[str]:
+    """Return the derived outputs that depend on any of the changed entries"""
+    changed = set(changed)
+    return [name for name, (inputs, _, _) in DERIVED_OUTPUTS.items() if changed.intersection(inputs)]
+
+
+def resolve_builder(spec: str) -> Callable[[], object]:
+    """Import a 'module:function' builder"""
+    module_name, _, func_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def rebuild(outputs: Iterable[str]) -> Dict[str, float]:
+    """Run the builders of the given outputs, returns seconds spent per output"""
+    timings = {}
+    for name in outputs:
+        start = time.perf_counter()
+        try:
+            resolve_builder(DERIVED_OUTPUTS[name][1])()
+        except Exception as e:
+            print(f"  ✗ {name}: {e}")
+            continue
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def snapshot(file_map: Dict[str, str]) -> Dict[str, int]:
+    """Current modification time of every watched file that exists"""
+    mtimes = {}
+    for filename in file_map:
+        try:
+            mtimes[filename] = os.stat(os.path.join(DATA_DIR, filename)).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+
+def watch(interval: float = 0.1, debounce: float = 0.25) -> None:
+    """Poll the data directory and rebuild affected outputs after each burst"""
+    file_map = config_file_map()
+    last = snapshot(file_map)
+    pending: Set[str] = set()
+    first_change = last_change = 0.0
+
+    print(f"Watching {DATA_DIR} ({len(DERIVED_OUTPUTS)} derived outputs), Ctrl+C to stop")
+    while True:
+        time.sleep(interval)
+        current = snapshot(file_map)
+        changed = {f for f in set(current) | set(last) if current.get(f) != last.get(f)}
+        last = current
+
+        now = time.perf_counter()
+        if changed:
+            if not pending:
+                first_change = now
+            last_change = now
+            pending.update(changed)
+            if 'dataConfig.json' in changed:
+                file_map = config_file_map()
+            continue
+
+        # Rebuild once the burst has been quiet for the debounce window
+        if pending and now - last_change >= debounce:
+            names = {file_map[f] for f in pending if f in file_map}
+            outputs = affected_outputs(names)
+            if 'productCatalog' in names:
+                # Builders share the per-process catalog cache
+                load_catalog(reload=True)
+            print(f"Changed: {', '.join(sorted(pending))}")
+            timings = rebuild(outputs)
+            for name, seconds in timings.items():
+                print(f"  ✓ {name} ({seconds * 1000:.0f} ms)")
+            if not outputs:
+                print("  (no derived outputs depend on these files)")
+            print(f"  Done {(time.perf_counter() - first_change) * 1000:.0f} ms after first change")
+            pending.clear()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rebuild derived data outputs when data files change')
+    parser.add_argument('--once', action='store_true', help='Rebuild every output once and exit')
+    parser.add_argument('--interval', type=float, default=0.1, help='Polling interval in seconds')
+    parser.add_argument('--debounce', type=float, default=0.25, help='Quiet time before rebuilding')
+    args = parser.parse_args(argv)
+
+    if args.once:
+        for name, seconds in rebuild(DERIVED_OUTPUTS).items():
+            print(f"✓ {name} ({seconds * 1000:.0f} ms)")
+        return
+
+    try:
+        watch(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1043,25 +1043,55 @@ if (!checkAuthentication()) {
          */
         calculateBelCountByDate(year, month, region = 'all') {
             if (!APP_DATA.belProfiles?.leaderboard) return 0;
-            
-            // Get filtered data based on region
-            let filteredData = APP_DATA.belProfiles.leaderboard;
-            if (region && region !== 'all') {
-                filteredData = filteredData.filter(leader => leader.region === region);
+
+            const index = this.getJoinDateIndex();
+            const key = region && region !== 'all' ? region : 'all';
+            const dates = index.joinDates[key];
+            if (!dates) return 0;
+
+            // Last day of the month as 'YYYY-MM-DD' (day 0 of the next month)
+            const lastDay = new Date(parseInt(year), month, 0).getDate();
+            const targetDate = `${year}-${String(month).padStart(2, '0')}-${String(lastDay).padStart(2, '0')}`;
+
+            // Binary search: number of join dates <= targetDate
+            let lo = 0;
+            let hi = dates.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (dates[mid] <= targetDate) lo = mid + 1; else hi = mid;
             }
-            
-            // Calculate the target date (end of the specified month)
-            const targetDate = new Date(parseInt(year), month - 1, 31);
-            
-            // Count BELs who joined before or during the target month
-            return filteredData.filter(leader => {
-                if (!leader.accountCreatedDate) {
-                    // Fallback: if no creation date, assume early joiner
-                    return true;
-                }
-                const creationDate = new Date(leader.accountCreatedDate);
-                return creationDate <= targetDate;
-            }).length;
+
+            // BELs without a creation date count as early joiners
+            return lo + (index.undated[key] || 0);
+        },
+
+        /**
+         * Sorted account creation dates per region (plus 'all')
+         * Sorted once from the loaded profiles (change log applied), so set_account_date
+         * updates are picked up immediately
+         * @returns {{joinDates: Object<string, string[]>, undated: Object<string, number>}}
+         */
+        getJoinDateIndex() {
+            if (this.joinDateIndex) return this.joinDateIndex;
+
+            const leaderboard = APP_DATA.belProfiles?.leaderboard || [];
+            const joinDates = { all: [] };
+            const undated = { all: 0 };
+            leaderboard.forEach(leader => {
+                const created = (leader.accountCreatedDate || '').slice(0, 10);
+                ['all', leader.region].forEach(region => {
+                    joinDates[region] = joinDates[region] || [];
+                    if (created) {
+                        joinDates[region].push(created);
+                    } else {
+                        undated[region] = (undated[region] || 0) + 1;
+                    }
+                });
+            });
+            Object.values(joinDates).forEach(dates => dates.sort());
+
+            this.joinDateIndex = { joinDates, undated };
+            return this.joinDateIndex;
         },
 
         /**
@@ -2128,6 +2158,23 @@ if (!checkAuthentication()) {
 
         // Build Top Products list from category data with Year/Region awareness
         getTopProductsFor(year = null, region = null) {
+            // Prefer the list precomputed by scripts/build_product_analysis.py
+            // ({product: units} ordered by units, prices from productCatalog.json)
+            const precomputed = this.getPrecomputedAnalysis('topProductsByYearRegion', year, region);
+            if (precomputed) {
+                const prices = this.getProductPrices();
+                return Object.entries(precomputed).map(([product, units], idx) => {
+                    const price = prices.get(product) || 0;
+                    return {
+                        rank: idx + 1,
+                        product,
+                        price: price > 0 ? `$${price.toLocaleString()}` : '-',
+                        units: units.toLocaleString(),
+                        total: price > 0 ? `$${(price * units).toLocaleString()}` : '-'
+                    };
+                });
+            }
+
             const categoryData = this.getCategoryDataFor(year, region);
             const productTotals = new Map(); // product -> {units, price, totalRevenue}
 
@@ -2509,6 +2556,21 @@ if (!checkAuthentication()) {
             };
         },
 
+        // Ready-made series from dashboard.json productAnalysis (null when not generated)
+        getPrecomputedAnalysis(key, year = null, region = null) {
+            const selectedYear = year || this.getSelectedYear();
+            const selectedRegion = region || window.selectedDashboardRegion || 'all';
+            return APP_DATA?.dashboard?.productAnalysis?.[key]?.[selectedYear]?.[selectedRegion] || null;
+        },
+
+        // Product name -> avgPrice from productCatalog.json (built once)
+        getProductPrices() {
+            if (this.productPrices?.size) return this.productPrices;
+            const catalog = APP_DATA.productCatalog?.productCatalog || [];
+            this.productPrices = new Map(catalog.map(product => [product.name, product.avgPrice || 0]));
+            return this.productPrices;
+        },
+
         // Resolve category/product units by year/region with sensible fallbacks
         getCategoryDataFor(year = null, region = null) {
             const selectedYear = year || this.getSelectedYear();
@@ -2516,10 +2578,22 @@ if (!checkAuthentication()) {
             const analysis = APP_DATA?.dashboard?.productAnalysis || {};
             const byYR = analysis.categoryDataByYearRegion || null;
 
+            // Cells are {category: {product: units}}; expand to [{product, units, price}]
+            // with prices from productCatalog.json
+            const prices = this.getProductPrices();
+            const toProductLists = cell => cell && Object.fromEntries(
+                Object.entries(cell).map(([category, products]) => [
+                    category,
+                    Object.entries(products || {}).map(([product, units]) => ({
+                        product, units, price: prices.get(product) || 0
+                    }))
+                ])
+            );
+
             // Helper to merge multiple categoryData objects
             const mergeCategoryData = (dataObjects) => {
                 const result = {};
-                dataObjects.forEach(dataObj => {
+                dataObjects.map(toProductLists).forEach(dataObj => {
                     if (!dataObj) return;
                     Object.entries(dataObj).forEach(([category, products]) => {
                         if (!result[category]) result[category] = [];
@@ -2549,7 +2623,7 @@ if (!checkAuthentication()) {
             if (byYR) {
                 // Exact match first
                 const exact = byYR?.[selectedYear]?.[selectedRegion];
-                if (exact) return exact;
+                if (exact) return toProductLists(exact);
 
                 // All years for a specific region
                 if (selectedYear === 'all' && selectedRegion !== 'all') {
@@ -2575,7 +2649,7 @@ if (!checkAuthentication()) {
 
                 // Fallback
                 const fallback = byYR?.all?.all;
-                if (fallback) return fallback;
+                if (fallback) return toProductLists(fallback);
             }
 
             // Legacy flat data
@@ -2590,26 +2664,35 @@ if (!checkAuthentication()) {
                     try { window.productCategoryChart.destroy(); } catch (e) {}
                 }
                 
-                // Get category data and calculate total units and revenue for each category
-                const categoryData = this.getCategoryDataFor(year, region);
-                const categoryStats = {};
-                
-                // Calculate total units and revenue for each category
-                Object.keys(categoryData).forEach(category => {
-                    const products = categoryData[category];
-                    const totalUnits = products.reduce((sum, p) => sum + (p.units || 0), 0);
-                    const totalRevenue = products.reduce((sum, p) => sum + ((p.units || 0) * (p.price || 0)), 0);
+                // Top 5 categories precomputed by scripts/build_product_analysis.py,
+                // or aggregated from category data when the totals are not available
+                const precomputed = this.getPrecomputedAnalysis('categoryTotalsByYearRegion', year, region);
+                let sortedCategories;
+                if (precomputed) {
+                    sortedCategories = precomputed
+                        .slice(0, 5)
+                        .map(t => [t.category, { units: t.units, revenue: t.revenue }]);
+                } else {
+                    const categoryData = this.getCategoryDataFor(year, region);
+                    const categoryStats = {};
                     
-                    categoryStats[category] = {
-                        units: totalUnits,
-                        revenue: totalRevenue
-                    };
-                });
-                
-                // Sort categories by total units and take top 5
-                const sortedCategories = Object.entries(categoryStats)
-                    .sort(([,a], [,b]) => b.units - a.units)
-                    .slice(0, 5);
+                    // Calculate total units and revenue for each category
+                    Object.keys(categoryData).forEach(category => {
+                        const products = categoryData[category];
+                        const totalUnits = products.reduce((sum, p) => sum + (p.units || 0), 0);
+                        const totalRevenue = products.reduce((sum, p) => sum + ((p.units || 0) * (p.price || 0)), 0);
+                        
+                        categoryStats[category] = {
+                            units: totalUnits,
+                            revenue: totalRevenue
+                        };
+                    });
+                    
+                    // Sort categories by total units and take top 5
+                    sortedCategories = Object.entries(categoryStats)
+                        .sort(([,a], [,b]) => b.units - a.units)
+                        .slice(0, 5);
+                }
                 
                 const labels = sortedCategories.map(([category]) => category);
                 const data = sortedCategories.map(([, stats]) => stats.units);
@@ -4367,23 +4450,21 @@ if (!checkAuthentication()) {
             `).join('');
         },
 
-        updateCustomerInsights(record) {
+        async updateCustomerInsights(record) {
             if (!record) return;
+
+            await this.loadCustomerInsights();
+            // Another BEL may have been opened while the file was loading
+            const currentBelId = this.getCurrentBelId();
+            if (currentBelId && currentBelId !== record.id) return;
             
-            const salesData = this.getBelSalesData(record.id);
-            const insights = this.generateInsights(record);
-            
-            // Calculate total sales statistics
-            const totalOrders = salesData.reduce((sum, sale) => sum + sale.quantity, 0);
-            const totalRevenue = salesData.reduce((sum, sale) => sum + sale.totalRevenue, 0);
+            const insights = this.getCustomerInsights(record.id, record);
             
             // Update categories section
             const tagsContainer = document.querySelector('.tags-container');
             if (tagsContainer) {
                 tagsContainer.innerHTML = insights.topCategories.map(category => {
-                    const categoryRevenue = salesData
-                        .filter(sale => sale.category === category)
-                        .reduce((sum, sale) => sum + sale.totalRevenue, 0);
+                    const categoryRevenue = insights.categoryRevenue[category] || 0;
                     
                     return `
                         <span class="bel-badge hot-selling" title="${category}: $${categoryRevenue.toLocaleString()} revenue">
@@ -4396,29 +4477,22 @@ if (!checkAuthentication()) {
             // Update products section with actual sales data
             const productList = document.querySelector('.product-list');
             if (productList) {
-                productList.innerHTML = insights.topProducts.map(productName => {
-                    const productData = salesData.find(sale => sale.productName === productName);
-                    const quantity = productData ? productData.quantity : 0;
-                    const revenue = productData ? productData.totalRevenue : 0;
-                    const description = productData ? productData.productDescription : '';
-                    
-                    return `
+                productList.innerHTML = insights.topProducts.map(product => `
                         <div class="product-item">
                             <div class="product-info">
-                                <div class="product-name">${productName}</div>
-                                <div class="product-description">${description}</div>
+                                <div class="product-name">${product.productName}</div>
+                                <div class="product-description">${product.productDescription}</div>
                                 <div class="product-stats">
-                                    <span class="quantity">Sold: ${quantity} units</span>
-                                    <span class="revenue">Revenue: $${revenue.toLocaleString()}</span>
+                                    <span class="quantity">Sold: ${product.quantity} units</span>
+                                    <span class="revenue">Revenue: $${product.totalRevenue.toLocaleString()}</span>
                                 </div>
                             </div>
                         </div>
-                    `;
-                }).join('');
+                    `).join('');
             }
             
             // Add sales summary header
-            const insightsTab = document.getElementById('insights-tab');
+            const insightsTab = document.getElementById('insights');
             if (insightsTab) {
                 let summaryDiv = insightsTab.querySelector('.sales-summary');
                 if (!summaryDiv) {
@@ -4433,41 +4507,165 @@ if (!checkAuthentication()) {
                         <div class="summary-stats">
                             <div class="stat-item">
                                 <span class="stat-label">Total Orders:</span>
-                                <span class="stat-value">${totalOrders}</span>
+                                <span class="stat-value">${insights.totalQuantity}</span>
                             </div>
                             <div class="stat-item">
                                 <span class="stat-label">Total Revenue:</span>
-                                <span class="stat-value">$${totalRevenue.toLocaleString()}</span>
+                                <span class="stat-value">$${insights.totalRevenue.toLocaleString()}</span>
                             </div>
                         </div>
                     </div>
+                    ${insights.monthlySales ? this.renderInsightOrders(insights) : ''}
                 `;
             }
         },
 
-        getCustomerInsights(referralId) {
+        // Order series and status breakdown from customerInsights.json for the insights year
+        renderInsightOrders(insights) {
+            const { year } = insights;
+            const inYear = key => year === 'all' || key.startsWith(year);
+            const months = Object.entries(insights.monthlySales).filter(([month]) => inYear(month));
+
+            // Amounts stay per currency (orders.json mixes currencies)
+            const amounts = {};
+            months.forEach(([, sales]) => {
+                Object.entries(sales.amount || {}).forEach(([currency, amount]) => {
+                    amounts[currency] = (amounts[currency] || 0) + amount;
+                });
+            });
+            const statusCounts = {};
+            Object.entries(insights.orderStatusByYear || {}).filter(([y]) => inYear(y)).forEach(([, counts]) => {
+                Object.entries(counts).forEach(([status, count]) => {
+                    statusCounts[status] = (statusCounts[status] || 0) + count;
+                });
+            });
+
+            const formatAmounts = byCurrency => Object.entries(byCurrency)
+                .map(([currency, amount]) => `${amount.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })} ${currency}`)
+                .join(' / ') || '—';
+            const orderCount = months.reduce((sum, [, sales]) => sum + sales.orders, 0);
+            const repeatRatio = insights.repeatCustomerRatio;
+
+            return `
+                <div class="summary-header">
+                    <h4>Orders (${year === 'all' ? 'All Years' : year})</h4>
+                    <div class="summary-stats">
+                        <div class="stat-item">
+                            <span class="stat-label">Orders:</span>
+                            <span class="stat-value">${orderCount}</span>
+                        </div>
+                        <div class="stat-item">
+                            <span class="stat-label">Order Amount:</span>
+                            <span class="stat-value">${formatAmounts(amounts)}</span>
+                        </div>
+                        <div class="stat-item">
+                            <span class="stat-label">Repeat Customers:</span>
+                            <span class="stat-value" title="${repeatRatio === null ? 'orders.json has no customer IDs' : ''}">${repeatRatio === null ? '—' : `${(repeatRatio * 100).toFixed(1)}%`}</span>
+                        </div>
+                    </div>
+                    <div class="order-status-tags" style="margin: 0.75rem 0;">
+                        ${Object.entries(statusCounts).map(([status, count]) => `
+                            <span class="bel-badge ${status.toLowerCase()}">${status}: ${count}</span>
+                        `).join('')}
+                    </div>
+                    ${months.length ? `
+                        <table class="bel-table" role="table" aria-label="Monthly orders">
+                            <thead>
+                                <tr role="row">
+                                    <th role="columnheader">Month</th>
+                                    <th role="columnheader">Orders</th>
+                                    <th role="columnheader">Amount</th>
+                                </tr>
+                            </thead>
+                            <tbody>
+                                ${months.map(([month, sales]) => `
+                                    <tr>
+                                        <td>${month}</td>
+                                        <td>${sales.orders}</td>
+                                        <td>${formatAmounts(sales.amount || {})}</td>
+                                    </tr>
+                                `).join('')}
+                            </tbody>
+                        </table>
+                    ` : '<p class="text-muted">No orders in this period.</p>'}
+                </div>
+            `;
+        },
+
+        // customerInsights.json is only needed by this modal, so it is fetched on first open
+        loadCustomerInsights() {
+            if (!this.customerInsightsPromise) {
+                this.customerInsightsPromise = dataLoader.loadJSON('data/customerInsights.json')
+                    .then(data => { APP_DATA.customerInsights = data; });
+            }
+            return this.customerInsightsPromise;
+        },
+
+        // Product name -> productCatalog.json entry (built once)
+        getCatalogProducts() {
+            if (this.catalogProducts?.size) return this.catalogProducts;
+            const catalog = APP_DATA.productCatalog?.productCatalog || [];
+            this.catalogProducts = new Map(catalog.map(product => [product.name, product]));
+            return this.catalogProducts;
+        },
+
+        getCustomerInsights(referralId, record = null) {
+            // Prefer insights precomputed by scripts/build_customer_insights.py; the product
+            // mix is taken for the header year filter, the same year as the modal's revenue
+            const precomputed = APP_DATA.customerInsights?.insights?.[referralId];
+            if (precomputed) {
+                const year = window.selectedDashboardYear || new Date().getFullYear().toString();
+                const mix = precomputed.productMixByYear?.[year];
+                // Top products are stored as {productName: quantity}; details come from the catalog
+                const catalog = this.getCatalogProducts();
+                const topProducts = Object.entries(mix?.topProducts || {})
+                    .sort(([, a], [, b]) => b - a)
+                    .map(([productName, quantity]) => {
+                        const product = catalog.get(productName) || {};
+                        const avgPrice = product.avgPrice || 0;
+                        return {
+                            productName,
+                            productDescription: product.description || '',
+                            category: product.category || '',
+                            quantity,
+                            avgPrice,
+                            totalRevenue: quantity * avgPrice
+                        };
+                    });
+                return {
+                    ...precomputed,
+                    year,
+                    topCategories: mix?.topCategories?.length ? mix.topCategories : ['—', '—'],
+                    categoryRevenue: mix?.categoryRevenue || {},
+                    topProducts,
+                    totalQuantity: mix?.totalQuantity || 0,
+                    totalRevenue: mix?.totalRevenue || 0
+                };
+            }
+
             // Initialize customer insights data if not exists
             if (!appState.customerInsights) {
                 appState.customerInsights = {};
             }
             
             if (!appState.customerInsights[referralId]) {
-                // Generate insights based on BEL level and characteristics
-                const record = AccountManagement.belData.find(x => x.id === referralId);
-                appState.customerInsights[referralId] = this.generateInsights(record);
+                const belRecord = record || AccountManagement.belData.find(x => x.id === referralId);
+                appState.customerInsights[referralId] = this.generateInsights(belRecord);
             }
             
             return appState.customerInsights[referralId];
         },
 
         generateInsights(record) {
-            // Generate insights based on actual sales data for this BEL
+            // Fallback when customerInsights.json is unavailable: derive from synthesized sales data
             const salesData = this.getBelSalesData(record.id);
             
             // Analyze top-selling categories
             const categoryStats = {};
+            const categoryRevenue = {};
             salesData.forEach(sale => {
                 categoryStats[sale.category] = (categoryStats[sale.category] || 0) + sale.quantity;
+                categoryRevenue[sale.category] = (categoryRevenue[sale.category] || 0) + sale.totalRevenue;
             });
             
             // Get top 4 categories by sales volume
@@ -4477,14 +4675,16 @@ if (!checkAuthentication()) {
                 .map(([category]) => category);
             
             // Get top 10 products by sales volume (increased from 8 to 10)
-            const topProducts = salesData
+            const topProducts = [...salesData]
                 .sort((a, b) => b.quantity - a.quantity)
-                .slice(0, 10)
-                .map(sale => sale.productName);
+                .slice(0, 10);
             
             return {
                 topCategories: topCategories.length > 0 ? topCategories : ['—', '—'],
-                topProducts: topProducts.length > 0 ? topProducts : ['—', '—']
+                categoryRevenue,
+                topProducts,
+                totalQuantity: salesData.reduce((sum, sale) => sum + sale.quantity, 0),
+                totalRevenue: salesData.reduce((sum, sale) => sum + sale.totalRevenue, 0)
             };
         },
 
@@ -7514,6 +7714,7 @@ if (!checkAuthentication()) {
                             <i class="fas fa-history"></i> View History Tickets
                         </button>
                     </div>
+                    <div class="summary-stats" id="support-summary-stats" style="margin-bottom: 1rem;"></div>
                     <div class="scrollable-table-container">
                         <table class="bel-table" id="open-tickets-table">
                             <thead>
@@ -7708,10 +7909,18 @@ if (!checkAuthentication()) {
         },
 
         async loadPayoutData() {
+            // DataLoader already merged payouts.json with payouts.deltas.jsonl
+            if (APP_DATA.payouts?.belPayoutHistory) {
+                window.PAYOUT_DATA = APP_DATA.payouts;
+                return;
+            }
             try {
                 const response = await fetch('data/payouts.json');
                 if (response.ok) {
-                    const payoutData = await response.json();
+                    const payoutData = dataLoader.applyDeltas('payouts', await response.json(), [
+                        ...await dataLoader.loadDeltas('data/payouts.deltas.jsonl.compacting'),
+                        ...await dataLoader.loadDeltas('data/payouts.deltas.jsonl')
+                    ]);
                     window.PAYOUT_DATA = payoutData;
                     APP_DATA.payouts = payoutData; // Also set in APP_DATA
                 } else {
@@ -8420,14 +8629,69 @@ if (!checkAuthentication()) {
             }
         },
 
+        getSupportTicketIndex() {
+            // Status / ticket-number lookups, built in one pass over the loaded tickets
+            if (this.supportTicketIndex) return this.supportTicketIndex;
+
+            const tickets = APP_DATA.contactSupport.tickets;
+            const byNumber = {};
+            const byStatus = {};
+            tickets.forEach(ticket => {
+                byNumber[ticket.ticketNumber] = ticket;
+                (byStatus[ticket.status] = byStatus[ticket.status] || []).push(ticket);
+            });
+
+            // supportSummary.json (scripts/build_support_summary.py) is only used while its
+            // digest matches the loaded tickets' numbers and statuses
+            const summary = APP_DATA.supportSummary;
+            const digest = this.getTicketsDigest(tickets);
+            const fresh = summary?.ticketsDigest?.count === digest.count && summary.ticketsDigest.hash === digest.hash;
+
+            this.supportTicketIndex = { byNumber, byStatus, summary: fresh ? summary : null };
+            return this.supportTicketIndex;
+        },
+
+        // Ticket count and 32-bit FNV-1a hash of "number\tstatus\n" lines (tickets_digest in build_support_summary.py)
+        getTicketsDigest(tickets) {
+            const bytes = new TextEncoder().encode(
+                tickets.map(t => `${t.ticketNumber ?? ''}\t${t.status ?? ''}\n`).join('')
+            );
+            let hash = 0x811c9dc5;
+            bytes.forEach(byte => { hash = Math.imul(hash ^ byte, 0x01000193) >>> 0; });
+            return { count: tickets.length, hash: hash.toString(16).padStart(8, '0') };
+        },
+
+        getTicketsByStatus(status) {
+            return this.getSupportTicketIndex().byStatus[status] || [];
+        },
+
+        findTicket(ticketId) {
+            return this.getSupportTicketIndex().byNumber[ticketId];
+        },
+
+        setTicketStatus(ticket, status) {
+            // Keep the status index in step with in-app changes (replying closes a ticket)
+            const { byStatus } = this.getSupportTicketIndex();
+            if (ticket.status === status) return;
+            // The summary's SLA and aging figures no longer describe these tickets
+            this.supportTicketIndex.summary = null;
+            byStatus[ticket.status] = (byStatus[ticket.status] || []).filter(t => t !== ticket);
+            ticket.status = status;
+            const list = byStatus[status] = byStatus[status] || [];
+            const tickets = APP_DATA.contactSupport.tickets;
+            const position = tickets.indexOf(ticket);
+            const insertAt = list.findIndex(t => tickets.indexOf(t) > position);
+            list.splice(insertAt === -1 ? list.length : insertAt, 0, ticket);
+        },
+
         renderContactSupportTickets() {
             const openTableBody = document.querySelector('#open-tickets-table tbody');
             if (!openTableBody) return;
             
-            const tickets = APP_DATA.contactSupport.tickets;
-            
-            // Separate tickets into open and history
-            const openTickets = tickets.filter(ticket => ticket.status === 'Open');
+            const openTickets = this.getTicketsByStatus('Open');
+            const { summary } = this.getSupportTicketIndex();
+            this.renderSupportSummary(summary);
+            const aging = new Map((summary?.agingTickets || []).map(t => [t.ticketNumber, t.ageHours]));
             
             // Render open tickets (no pagination)
             openTableBody.innerHTML = openTickets.map(ticket => `
@@ -8436,7 +8700,10 @@ if (!checkAuthentication()) {
                     <td>${ticket.belName}</td>
                     <td><a href="#" class="referral-id-link" data-referral-id="${ticket.referralId}">${ticket.referralId}</a></td>
                     <td>${ticket.subject}</td>
-                    <td><span class="bel-badge pending">${ticket.status}</span></td>
+                    <td>
+                        <span class="bel-badge pending">${ticket.status}</span>
+                        ${aging.has(ticket.ticketNumber) ? `<span class="bel-badge canceled" title="Open for ${aging.get(ticket.ticketNumber)} hours as of ${summary.asOf}">Aging</span>` : ''}
+                    </td>
                     <td>
                         <button class="bel-btn-s secondary support-view-btn" data-ticket-id="${ticket.ticketNumber}">
                             <i class="fas fa-eye"></i> View Detail
@@ -8452,6 +8719,32 @@ if (!checkAuthentication()) {
             }
         },
 
+        // Status counts, SLA percentiles and aging count from supportSummary.json
+        renderSupportSummary(summary) {
+            const container = document.getElementById('support-summary-stats');
+            if (!container) return;
+            if (!summary) {
+                container.innerHTML = '';
+                return;
+            }
+
+            const { firstResponseHours: firstResponse, resolutionHours: resolution } = summary.sla || {};
+            const hours = (stats, p) => (stats?.count ? `${stats[p]}h` : '—');
+            const items = [
+                ...Object.entries(summary.counts || {}).map(([status, count]) => [`${status} Tickets`, count]),
+                ['First Response p50 / p90', `${hours(firstResponse, 'p50')} / ${hours(firstResponse, 'p90')}`],
+                ['Resolution p50 / p90', `${hours(resolution, 'p50')} / ${hours(resolution, 'p90')}`],
+                [`Open > ${summary.agingThresholdHours}h`, (summary.agingTickets || []).length]
+            ];
+            container.title = `supportSummary.json as of ${summary.asOf}`;
+            container.innerHTML = items.map(([label, value]) => `
+                <div class="stat-item">
+                    <span class="stat-label">${label}</span>
+                    <span class="stat-value">${value}</span>
+                </div>
+            `).join('');
+        },
+
         ensureHistoryTicketsModal() {
             if (this.historyTicketsModalEl) return this.historyTicketsModalEl;
             
@@ -8545,9 +8838,7 @@ if (!checkAuthentication()) {
             
             if (historyNextBtn) {
                 historyNextBtn.addEventListener('click', () => {
-                    const tickets = APP_DATA.contactSupport.tickets;
-                    const allHistoryTickets = tickets.filter(ticket => ticket.status === 'Closed');
-                    const total = allHistoryTickets.length;
+                    const total = this.getTicketsByStatus('Closed').length;
                     if (appState.historyTicketsPage * appState.historyTicketsRowsPerPage < total) {
                         appState.historyTicketsPage++;
                         this.renderHistoryTicketsModal();
@@ -8560,8 +8851,7 @@ if (!checkAuthentication()) {
             const modalTableBody = document.querySelector('#history-tickets-modal-table tbody');
             if (!modalTableBody) return;
             
-            const tickets = APP_DATA.contactSupport.tickets;
-            const allHistoryTickets = tickets.filter(ticket => ticket.status === 'Closed');
+            const allHistoryTickets = this.getTicketsByStatus('Closed');
             
             // Implement pagination for history tickets modal
             const historyTotal = allHistoryTickets.length;
@@ -8974,7 +9264,7 @@ if (!checkAuthentication()) {
             // send reply functionality
             this.supportModalEl.querySelector('#sup-send-btn')?.addEventListener('click', () => {
                 const ticketId = this.supportModalEl.dataset.ticketId;
-                const ticket = APP_DATA.contactSupport.tickets.find(t => t.ticketNumber === ticketId);
+                const ticket = this.findTicket(ticketId);
                 if (!ticket) return;
                 
                 const textarea = this.supportModalEl.querySelector('#sup-reply-input');
@@ -8995,7 +9285,7 @@ if (!checkAuthentication()) {
                 });
                 
                 // 回覆後直接關閉ticket
-                ticket.status = 'Closed';
+                this.setTicketStatus(ticket, 'Closed');
                 textarea.value = '';
                 this.clearSupportAttachments();
                 this.fillSupportModal(ticket);
@@ -9258,11 +9548,7 @@ if (!checkAuthentication()) {
         },
 
         openSupportModal(ticketId) {
-            // Try to find ticket in both data sources
-            let ticket = APP_DATA.contactSupport.tickets.find(t => t.ticketNumber === ticketId);
-            if (!ticket) {
-                ticket = APP_DATA.contactSupport.tickets.find(t => t.ticketNumber === ticketId);
-            }
+            const ticket = this.findTicket(ticketId);
             if (!ticket) return;
 
             const modal = this.ensureSupportModal();
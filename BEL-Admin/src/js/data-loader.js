@@ -7,6 +7,23 @@ class DataLoader {
     constructor() {
         this.loadedData = {};
         this.loadingPromises = {};
+        // Files that failed to load or did not have the expected structure: [{file, path, message}]
+        this.loadErrors = [];
+    }
+
+    /**
+     * Top-level record arrays per data file (mirrors SCHEMAS in scripts/data_schema.py)
+     */
+    static get RECORD_KEYS() {
+        return {
+            payouts: 'belPayoutHistory',
+            orders: 'history',
+            content: 'assets',
+            contactSupport: 'tickets',
+            announcements: 'announcements',
+            productCatalog: 'productCatalog',
+            belProfiles: 'leaderboard'
+        };
     }
 
     /**
@@ -36,6 +53,7 @@ class DataLoader {
             })
             .catch(error => {
                 console.error(`Error loading ${filePath}:`, error);
+                this.loadErrors.push({ file: filePath, path: '$', message: error.message });
                 // Return fallback data structure
                 return this.getFallbackData(filePath);
             });
@@ -54,10 +72,14 @@ class DataLoader {
             
             // Extract data files from config (support both array and object format)
             let dataFiles = {};
+            const deltaFiles = {};
             if (Array.isArray(config.dataFiles)) {
                 // Convert array format to object format
                 config.dataFiles.forEach(fileConfig => {
                     dataFiles[fileConfig.name] = `data/${fileConfig.file}`;
+                    if (fileConfig.deltas) {
+                        deltaFiles[fileConfig.name] = `data/${fileConfig.deltas}`;
+                    }
                 });
             } else {
                 // Use object format directly
@@ -69,6 +91,16 @@ class DataLoader {
                 // Ensure filePath is a string
                 const validFilePath = typeof filePath === 'string' ? filePath : `data/${filePath}`;
                 const data = await this.loadJSON(validFilePath);
+                this.checkStructure(key, validFilePath, data);
+                if (deltaFiles[key]) {
+                    // Apply pending change log on top of the base snapshot (a log being
+                    // compacted by scripts/data_deltas.py goes first)
+                    const ops = [
+                        ...await this.loadDeltas(`${deltaFiles[key]}.compacting`),
+                        ...await this.loadDeltas(deltaFiles[key])
+                    ];
+                    this.applyDeltas(key, data, ops);
+                }
                 return [key, data];
             });
 
@@ -87,6 +119,97 @@ class DataLoader {
         }
     }
 
+    /**
+     * Report a data file whose top-level record array is missing or not an array.
+     * Full validation runs offline (scripts/data_schema.py); this only keeps a
+     * malformed file from passing unnoticed.
+     * @param {string} name - Data file name from dataConfig
+     * @param {string} filePath - Path the file was loaded from
+     * @param {Object} data - Loaded data
+     * @returns {boolean} Whether the structure looks valid
+     */
+    checkStructure(name, filePath, data) {
+        const recordKey = DataLoader.RECORD_KEYS[name];
+        let error = null;
+        if (!data || typeof data !== 'object' || Array.isArray(data)) {
+            error = { file: filePath, path: '$', message: 'expected object' };
+        } else if (recordKey && !Array.isArray(data[recordKey])) {
+            error = { file: filePath, path: `$.${recordKey}`, message: 'expected array' };
+        }
+        if (error) {
+            console.error(`Invalid data in ${error.file} at ${error.path}: ${error.message}`);
+            this.loadErrors.push(error);
+        }
+        return !error;
+    }
+
+    /**
+     * Load the append-only change log of a data file
+     * @param {string} filePath - Path to the .deltas.jsonl file
+     * @returns {Promise<Array>} Operations in log order (empty if there is no log)
+     */
+    async loadDeltas(filePath) {
+        try {
+            const response = await fetch(filePath);
+            if (!response.ok) {
+                return [];
+            }
+            const lines = (await response.text()).split('\n');
+            // The last segment has no newline: a batch still being written (or empty)
+            lines.pop();
+            return lines.filter(line => line.trim()).map(line => JSON.parse(line));
+        } catch (error) {
+            console.warn(`Error loading change log ${filePath}:`, error);
+            return [];
+        }
+    }
+
+    /**
+     * Apply change log operations to a loaded base snapshot (in place).
+     * Mirrors scripts/data_deltas.py.
+     * @param {string} name - Data file name from dataConfig (belProfiles, payouts)
+     * @param {Object} data - Base snapshot
+     * @param {Array} ops - Operations from loadDeltas
+     * @returns {Object} The updated snapshot
+     */
+    applyDeltas(name, data, ops) {
+        const targets = {
+            belProfiles: ['leaderboard', 'id'],
+            payouts: ['belPayoutHistory', 'belId']
+        };
+        if (!targets[name] || !ops.length) {
+            return data;
+        }
+
+        const [listKey, idKey] = targets[name];
+        const entries = new Map((data[listKey] || []).map(entry => [entry[idKey], entry]));
+
+        ops.forEach(op => {
+            const entry = entries.get(op.belId);
+            if (!entry) {
+                return;
+            }
+            if (op.op === 'set_metric') {
+                entry.monthlyData = entry.monthlyData || {};
+                const yearData = entry.monthlyData[op.year] = entry.monthlyData[op.year] || {};
+                yearData[op.month] = { ...(yearData[op.month] || {}), ...op.values };
+            } else if (op.op === 'set_account_date') {
+                entry.accountCreatedDate = op.date;
+            } else if (op.op === 'set_level') {
+                entry.level = op.level;
+            } else if (op.op === 'append_payout') {
+                entry.payoutHistory = entry.payoutHistory || [];
+                const exists = entry.payoutHistory.some(p =>
+                    p.payoutId === op.payout.payoutId && p.year === op.payout.year && p.month === op.payout.month);
+                if (!exists) {
+                    entry.payoutHistory.push(op.payout);
+                }
+            }
+        });
+
+        return data;
+    }
+
     /**
      * Get fallback data for specific files
      * @param {string} filePath - The file path that failed to load
@@ -199,6 +322,7 @@ class DataLoader {
     clearCache() {
         this.loadedData = {};
         this.loadingPromises = {};
+        this.loadErrors = [];
     }
 
     /**